@@ -1,18 +1,457 @@
-import json
+import orjson
 import re
-from datetime import datetime
-from bs4 import BeautifulSoup
-import requests
-import time
+from datetime import datetime, timezone
+from functools import lru_cache
+import lxml.html
+from lxml import etree
+import aiohttp
+import asyncio
 import pytz
 import random
 import os
+import time
+import gzip
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name`"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+def _clean(node: lxml.html.HtmlElement) -> str:
+    """Text content of a value node with whitespace collapsed"""
+    return ' '.join(node.text_content().split())
+
+# Pages are fetched as raw bytes and decoded by libxml2 itself
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Nodes the detail-page extractors read, keyed by role. They are gathered in a
+# single document walk (the union below) instead of one full scan per extractor.
+PAGE_NODE_STEPS = {
+    'ld_json': 'script[@type="application/ld+json"]',
+    'title_divs': f'div[{_has_class("text-xl")}]',
+    'countdown': 'div[@data-controller="countdown-bar"]',
+    'pre_spans': f'span[{_has_class("whitespace-pre")}]',
+    'schedule_links': f'a[{_has_class("line-clamp-1")}]',
+    'schedule_info': f'div[{_has_class("release-schedule-info")}]',
+    # Stats grid on the detail page (episodes, run time, format, ...)
+    'stats_grid': 'div[@class="grid grid-flow-col auto-cols-fr w-full text-center mb-8 gap-2"]',
+    'status_labels': f'div[{_has_class("text-sm")}][text()="Status"]',
+    'date_links': 'a[@class="link link-hover"][@href]',
+}
+PAGE_NODES_XPATH = etree.XPath(' | '.join(f'//{step}' for step in PAGE_NODE_STEPS.values()))
+PAGE_NODE_TESTS = {role: etree.XPath(f'boolean(self::{step})') for role, step in PAGE_NODE_STEPS.items()}
+
+PageNodes = Dict[str, List[lxml.html.HtmlElement]]
+
+# Stats values located directly by their label, so no Python loop over candidate nodes
+EPISODES_LABEL = f'(//div[{_has_class("whitespace-nowrap")}][contains(., "Episodes")])[1]'
+EPISODES_VALUE_XPATH = etree.XPath(
+    f'({EPISODES_LABEL}/descendant::div[{_has_class("flex")}]'
+    f' | {EPISODES_LABEL}/following::div[{_has_class("flex")}])[1]'
+)
+STAT_LABEL_XPATH = etree.XPath('(./div//div[text()=$label])[1]')
+
+# Patterns used on every article / detail page, compiled once
+MAL_ID_PATTERN = re.compile(r'/(\d+)(?:/|$)')
+EPISODE_PATTERN = re.compile(r'EP(\d+)')
+SCHEDULE_DATE_PATTERN = re.compile(r'/schedule\?date=')
+SEASON_HREF_PATTERN = re.compile(r'/[a-z]+-\d{4}/')
+
+# X-RateLimit-Reset values above this are epoch timestamps rather than
+# delays; no rate-limit window lasts anywhere near 1e9 seconds
+RESET_EPOCH_MIN = 1e9
+
+# Livechart lists premiere dates in Japanese time
+JST = pytz.timezone('Asia/Tokyo')
+
+@lru_cache(maxsize=4096)
+def premiere_date_to_utc(date_str: str) -> str:
+    """Convert a JST premiere date like "Dec 11, 2023" to an ISO 8601 UTC string"""
+    date_obj = datetime.strptime(date_str, '%b %d, %Y')
+    return JST.localize(date_obj).astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 class AnimeScraperError(Exception):
     """Custom exception for scraper errors"""
     pass
 
+class HostRateLimiter:
+    """
+    Concurrency limit plus a shared "not before" time for a single host
+    
+    Requests only wait when the server has asked for it via `Retry-After`
+    or an exhausted `X-RateLimit-*` budget, instead of a fixed sleep per request.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.next_allowed_at = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        delay = self.next_allowed_at - time.monotonic()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                # __aexit__ does not run if we are cancelled here, so give the permit back
+                self.semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+    def defer(self, seconds: float):
+        """Hold back every request to this host for at least `seconds`"""
+        self.next_allowed_at = max(self.next_allowed_at, time.monotonic() + seconds)
+
+    def update(self, headers, default_retry_after: float = 0.0):
+        """Adjust the next allowed request time from a response's rate-limit headers"""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                self.defer(float(retry_after))
+            except ValueError:
+                self.defer(default_retry_after)
+            return
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            if default_retry_after:
+                self.defer(default_retry_after)
+            return
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+        # Reset is either an epoch timestamp or seconds until the window resets;
+        # a stale timestamp means the window has already reset
+        if reset > RESET_EPOCH_MIN:
+            reset = reset - time.time()
+        reset_in = max(0.0, reset)
+        if remaining <= 0:
+            self.defer(reset_in)
+        else:
+            # Spread the remaining budget evenly over the rest of the window
+            self.defer(reset_in / remaining)
+
+# Page parsing. These are module-level functions of the page bytes, so
+# process-pool workers call them directly without building a scraper.
+
+def convert_timestamp_to_utc(timestamp: str) -> str:
+    """Convert Unix timestamp to UTC datetime format"""
+    try:
+        return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+    except (ValueError, TypeError):
+        return None
+
+def collect_page_nodes(tree: lxml.html.HtmlElement) -> PageNodes:
+    """Walk the detail page once and bucket the nodes each extractor needs by role"""
+    nodes = {role: [] for role in PAGE_NODE_STEPS}
+    for node in PAGE_NODES_XPATH(tree):
+        for role, test in PAGE_NODE_TESTS.items():
+            if test(node):
+                nodes[role].append(node)
+    return nodes
+
+def extract_page_content(tree: lxml.html.HtmlElement) -> Dict[str, Any]:
+    """Extract detailed information from anime page"""
+    try:
+        nodes = collect_page_nodes(tree)
+        ld_json = extract_ld_json(nodes)
+        titles = extract_titles(nodes, ld_json)
+        premiere_season = extract_premiere_and_season(nodes)
+        
+        page_content = {
+            'jp_title': titles['jp_title'],
+            'title': titles['title'],
+            'airing_time': extract_airing_time(nodes),
+            'episodes': extract_episodes(tree, nodes),
+            'episode_number': extract_episode_number(nodes),
+            'run_time': extract_run_time(nodes),
+            'status': extract_status(nodes, ld_json),
+            'premiere': premiere_season['premiere'],
+            'season': premiere_season['season'],
+            'format': extract_format(nodes),
+        }
+        
+        # # Remove None values
+        # page_content = {k: v for k, v in page_content.items() if v is not None}
+        
+        return page_content
+        
+    except Exception as e:
+        print(f"Error extracting page content: {str(e)}")
+        return {}
+
+def extract_ld_json(nodes: PageNodes) -> Dict[str, Any]:
+    """Decode the page's schema.org JSON-LD block once for all extractors"""
+    try:
+        scripts = nodes['ld_json']
+        if scripts and scripts[0].text:
+            data = orjson.loads(scripts[0].text)
+            if isinstance(data, dict):
+                return data
+    except orjson.JSONDecodeError as e:
+        print(f"Error decoding JSON-LD: {str(e)}")
+    return {}
+
+def extract_titles(nodes: PageNodes, ld_json: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Extract both Japanese and English titles
+    
+    Logic:
+    1. Get main name from schema as jp_title
+    2. From alternateName array:
+       - If array has entries, first entry is English title
+       - If no array or empty, fallback to jp_title
+    3. Fallback to HTML parsing if schema fails
+    """
+    titles = {
+        'jp_title': None,
+        'title': None
+    }
+    
+    try:
+        if ld_json:
+            # Get Japanese title from main name
+            titles['jp_title'] = ld_json.get('name')
+            
+            # Handle alternate names array
+            alternate_names = ld_json.get('alternateName', [])
+            if isinstance(alternate_names, list) and len(alternate_names) > 1:
+                titles['title'] = alternate_names[0]  # First entry is English title
+            else:
+                titles['title'] = titles['jp_title']  # Fallback to Japanese title
+
+        # Fallback to HTML parsing if schema data isn't available or incomplete
+        if not titles['jp_title'] or not titles['title']:
+            for div in nodes['title_divs']:
+                title_spans = div.xpath(f'.//span[{_has_class("text-base-content")}]')
+                if title_spans:
+                    titles['title'] = title_spans[0].text_content().strip()
+                elif 'text-base-content' in div.get('class', '').split():
+                    titles['jp_title'] = div.text_content().strip()
+            
+            # If still missing title, use jp_title as fallback
+            if not titles['title'] and titles['jp_title']:
+                titles['title'] = titles['jp_title']
+
+    except AttributeError as e:
+        print(f"Error extracting titles: {str(e)}")
+        pass
+    
+    return titles
+
+def extract_mal_id(tree: lxml.html.HtmlElement) -> str:
+    """Extract MAL ID from MyAnimeList URL"""
+    try:
+        # Try to find MAL link with different possible classes
+        mal_links = tree.xpath(f'.//a[{_has_class("mal-icon")}]') or \
+                    tree.xpath(f'.//a[{_has_class("lc-btn-myanimelist")}]')
+                  
+        if mal_links and mal_links[0].get('href') is not None:
+            match = MAL_ID_PATTERN.search(mal_links[0].get('href'))
+            if match:
+                return match.group(1)
+    except AttributeError:
+        pass
+    return None
+
+def extract_airing_time(nodes: PageNodes) -> str:
+    """Extract and convert airing timestamp"""
+    try:
+        countdown_divs = nodes['countdown']
+        if countdown_divs and countdown_divs[0].get('data-countdown-bar-timestamp') is not None:
+            timestamp = countdown_divs[0].get('data-countdown-bar-timestamp')
+            return convert_timestamp_to_utc(timestamp)
+    except AttributeError:
+        pass
+    return None
+
+def extract_episodes(tree: lxml.html.HtmlElement, nodes: PageNodes) -> str:
+    """Extract total episodes information"""
+    try:
+        # First "flex" div after the Episodes label in document order (descendants included)
+        episodes_spans = EPISODES_VALUE_XPATH(tree)
+        if episodes_spans:
+            text = _clean(episodes_spans[0])
+            return text if '/' in text else f"0/{text}"
+        
+        episode_spans = nodes['pre_spans']
+        if episode_spans and episode_spans[0].text_content():
+            episodes_text = episode_spans[0].text_content().strip()
+            if '/' in episodes_text:
+                return episodes_text.strip()
+    except AttributeError:
+        pass
+    return "0/0"
+
+def extract_episode_number(nodes: PageNodes) -> int:
+    """Extract current episode number from the details page"""
+    try:
+        # Look for the episode number in the schedules link text
+        schedule_links = nodes['schedule_links']
+        if schedule_links:
+            episode_spans = schedule_links[0].xpath(f'.//span[{_has_class("font-medium")}]')
+            if episode_spans:
+                episode_text = episode_spans[0].text_content().strip()
+                match = EPISODE_PATTERN.search(episode_text)
+                if match:
+                    return int(match.group(1))
+                    
+        # Backup method: look in the release-schedule-info div
+        schedule_infos = nodes['schedule_info']
+        if schedule_infos:
+            episode_text = schedule_infos[0].text_content().strip()
+            match = EPISODE_PATTERN.search(episode_text)
+            if match:
+                return int(match.group(1))
+
+    except (AttributeError, ValueError) as e:
+        print(f"Error extracting episode number: {str(e)}")
+    
+    return None
+
+def extract_run_time(nodes: PageNodes) -> str:
+    """Extract runtime information"""
+    try:
+        # Read the value next to the "Run time" label in the stats grid
+        grid_containers = nodes['stats_grid']
+        if grid_containers:
+            return extract_stat_value(grid_containers[0], 'Run time')
+
+    except AttributeError:
+        pass
+    return None
+
+def extract_status(nodes: PageNodes, ld_json: Dict[str, Any]) -> str:
+    """Extract status information"""
+    try:
+        # Try schema.org data first
+        if ld_json:
+            if ld_json.get('url', '').endswith('/11908'):  # Verify we have the right data
+                return 'releasing'  # Status is not in schema, but we know it's releasing
+        
+        # Fallback to HTML parsing
+        status_labels = nodes['status_labels']
+        if status_labels:
+            status_tag = status_labels[0].tail
+            return status_tag.strip() if status_tag else "Unknown"
+    except AttributeError:
+        pass
+    return "Unknown"
+
+def extract_premiere_and_season(nodes: PageNodes) -> Dict[str, str]:
+    """Extract premiere date and season"""
+    info = {
+        'premiere': None,
+        'season': None
+    }
+    
+    try:
+        # Find the premiere date
+        links = nodes['date_links']
+        premiere_link = next((a for a in links if SCHEDULE_DATE_PATTERN.search(a.get('href'))), None)
+        if premiere_link is not None:
+            date_str = premiere_link.text_content().strip()  # e.g. "Dec 11, 2023"
+            
+            # Since the site typically lists dates for Japanese releases,
+            # assume JST (UTC+9) and convert to UTC. Premiere dates repeat
+            # across a season, so the conversion is memoized.
+            info['premiere'] = premiere_date_to_utc(date_str)
+        
+        # Find the season
+        season_link = next((a for a in links if SEASON_HREF_PATTERN.search(a.get('href'))), None)
+        if season_link is not None:
+            info['season'] = season_link.text_content().strip()
+
+    except (AttributeError, ValueError):
+        pass
+    
+    return info
+
+def extract_format(nodes: PageNodes) -> str:
+    """Extract anime format"""
+    try:
+        # This is the container with all metadata including format
+        stats_containers = nodes['stats_grid']
+        if stats_containers:
+            return extract_stat_value(stats_containers[0], 'Format')
+
+    except AttributeError:
+        pass
+    
+    return None
+
+def extract_stat_value(grid: lxml.html.HtmlElement, label: str) -> str:
+    """Read the value following a stats grid label without touching the label text"""
+    labels = STAT_LABEL_XPATH(grid, label=label)
+    if not labels:
+        return None
+    # The value is normally the label's next sibling, otherwise loose text after it
+    value_node = labels[0].getnext()
+    if value_node is not None:
+        return _clean(value_node)
+    return ' '.join((labels[0].tail or '').split())
+
+def extract_anime_urls(html_content: bytes, base_url: str) -> List[Dict[str, str]]:
+    """Extract anime URLs and basic info from season page"""
+    tree = lxml.html.fromstring(html_content, parser=HTML_PARSER)
+    anime_articles = tree.xpath(f'.//article[{_has_class("anime")}]')
+    
+    anime_data = []
+    for article in anime_articles:
+        try:
+            livechart_id = article.get('data-anime-id')
+            title = article.get('data-romaji')
+            if not title:
+                title_elems = article.xpath(f'.//h3[{_has_class("main-title")}]')
+                title = title_elems[0].text_content().strip() if title_elems else None
+
+            url_elems = article.xpath('.//a[@href]')
+            relative_url = url_elems[0].get('href') if url_elems else None
+            full_url = f"{base_url}{relative_url}" if relative_url else None
+
+            # Extract airing timestamp
+            countdown_divs = article.xpath('.//div[@data-controller="countdown-bar"]')
+            airing_time = None
+            if countdown_divs and countdown_divs[0].get('data-countdown-bar-timestamp') is not None:
+                airing_time = countdown_divs[0].get('data-countdown-bar-timestamp')
+
+            # Get MAL ID
+            mal_id = extract_mal_id(article)
+
+            anime_data.append({
+                'title': title,
+                'livechart_url': full_url,
+                'livechart_id': livechart_id,
+                'mal_id': mal_id,
+                'airing_time': convert_timestamp_to_utc(airing_time) if airing_time else None
+            })
+
+        except Exception as e:
+            print(f"Error processing article: {str(e)}")
+            continue
+
+    return anime_data
+
+def parse_anime_details(html_content: bytes) -> Dict[str, Any]:
+    """Parse an anime detail page into page content and MAL ID"""
+    tree = lxml.html.fromstring(html_content, parser=HTML_PARSER)
+    page_content = extract_page_content(tree)
+    
+    # Extract MAL ID from the details page
+    mal_id = extract_mal_id(tree)  # This will be more reliable
+    
+    return {
+        'page_content': page_content,
+        'mal_id': mal_id
+    }
+
 class LivechartScraper:
     def __init__(self):
         self.headers = {
@@ -29,440 +468,259 @@ class LivechartScraper:
             'Sec-Fetch-User': '?1'
         }
         self.base_url = "https://www.livechart.me"
-        self.output_file = 'output/livechart_episodes.json'
-        self.progress_file = 'output/scraping_progress.json'
+        self.output_file = 'output/livechart_episodes.jsonl'
+        self.completed_file = 'output/completed_urls.txt'
+        self.position_file = 'output/last_position.json'
+        # Output and progress files written by earlier versions; imported once
+        # into the files above if those do not exist yet
+        self.legacy_output_file = 'output/livechart_episodes.json'
+        self.legacy_progress_file = 'output/scraping_progress.json'
+        # Fetched pages are cached on disk and reused until they are cache_ttl seconds old
+        self.cache_dir = 'output/cache'
+        self.cache_ttl = 24 * 60 * 60
         self.seasons = ['winter', 'spring', 'summer', 'fall']
         self.years = [2024, 2025, 2026]
         self.content_types = ['tv', 'movies', 'ovas']
+        # Upper bound on concurrent requests to livechart.me
+        self.max_concurrency = 8
+        self.rate_limiter = HostRateLimiter(self.max_concurrency)
+        # Executor for CPU-bound HTML parsing (None = default thread pool);
+        # main_async installs a process pool so parsing uses all cores
+        self.parse_pool = None
+        # Append handles for output_file and completed_file, opened on first write
+        self._out_fh = None
+        self._completed_fh = None
         # self.seasons = ['winter']
         # self.years = [2025]
         # self.content_types = ['ovas']
 
+    def import_legacy_files(self):
+        """Convert output and progress from the old single-JSON files, so a resumed run keeps its progress"""
+        if any(os.path.exists(path) for path in (self.output_file, self.completed_file, self.position_file)):
+            return
+        try:
+            if os.path.exists(self.legacy_output_file):
+                with open(self.legacy_output_file, 'rb') as f:
+                    self.append_entries(orjson.loads(f.read()))
+            if os.path.exists(self.legacy_progress_file):
+                with open(self.legacy_progress_file, 'rb') as f:
+                    legacy_progress = orjson.loads(f.read())
+                self.mark_completed(legacy_progress.get('completed', []))
+                if legacy_progress.get('last_position'):
+                    self.save_progress(legacy_progress['last_position'])
+                print(f"Imported progress from {self.legacy_progress_file}")
+        except Exception as e:
+            print(f"Error importing legacy data: {str(e)}")
+        finally:
+            # Flush the imported lines before load_existing_data reads them back
+            self.close()
+
     def load_existing_data(self) -> tuple:
-        """Load existing data and progress if available"""
-        all_results = []
+        """Load the existing entry count and progress if available"""
+        self.import_legacy_files()
+        entry_count = 0
         progress = {
             'completed': set(),
             'last_position': None
         }
         
-        # Load main data file if it exists
+        # Stream the JSONL output to count entries and recover completed URLs
         try:
             if os.path.exists(self.output_file):
-                with open(self.output_file, 'r', encoding='utf-8') as f:
-                    all_results = json.load(f)
-                print(f"Loaded {len(all_results)} existing entries from {self.output_file}")
+                with open(self.output_file, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            progress['completed'].add(orjson.loads(line)['livechart_url'])
+                            entry_count += 1
+                print(f"Loaded {entry_count} existing entries from {self.output_file}")
         except Exception as e:
             print(f"Error loading existing data: {str(e)}")
 
-        # Load progress file if it exists
+        # Load completed URLs and the last position if they exist
         try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    temp_progress = json.load(f)
-                    progress['completed'] = set(temp_progress['completed'])
-                    progress['last_position'] = temp_progress['last_position']
-                print(f"Loaded progress information from {self.progress_file}")
+            if os.path.exists(self.completed_file):
+                with open(self.completed_file, encoding='utf-8') as f:
+                    progress['completed'].update(line.rstrip('\n') for line in f if line.strip())
+            if os.path.exists(self.position_file):
+                with open(self.position_file, 'rb') as f:
+                    progress['last_position'] = orjson.loads(f.read())
+            print(f"Loaded progress information from {self.completed_file} and {self.position_file}")
         except Exception as e:
             print(f"Error loading progress: {str(e)}")
 
-        return all_results, progress
+        return entry_count, progress
 
-    def save_progress(self, completed_urls: set, current_position: dict):
-        """Save progress information"""
+    def mark_completed(self, urls):
+        """Append newly completed URLs to the completed-URLs file"""
         try:
-            progress_data = {
-                'completed': list(completed_urls),  # Convert set to list for JSON
-                'last_position': current_position
-            }
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, ensure_ascii=False, indent=2)
+            if self._completed_fh is None:
+                os.makedirs(os.path.dirname(self.completed_file) or '.', exist_ok=True)
+                self._completed_fh = open(self.completed_file, 'a', buffering=1, encoding='utf-8')
+            self._completed_fh.write(''.join(f"{url}\n" for url in urls))
         except Exception as e:
             print(f"Error saving progress: {str(e)}")
 
-    def save_results(self, results: list):
-        """Save current results to file"""
+    def save_progress(self, current_position: dict):
+        """Save the last scraped position"""
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
-            print(f"Saved {len(results)} entries to {self.output_file}")
+            with open(self.position_file, 'wb') as f:
+                f.write(orjson.dumps(current_position, option=orjson.OPT_INDENT_2))
+        except Exception as e:
+            print(f"Error saving progress: {str(e)}")
+
+    def append_entries(self, entries: list):
+        """Append new entries to the JSONL output file"""
+        if not entries:
+            return
+        try:
+            if self._out_fh is None:
+                os.makedirs(os.path.dirname(self.output_file) or '.', exist_ok=True)
+                self._out_fh = open(self.output_file, 'a', buffering=1 << 20, encoding='utf-8')
+            self._out_fh.write(''.join(orjson.dumps(entry).decode() + '\n' for entry in entries))
+            self._out_fh.flush()
+            print(f"Appended {len(entries)} entries to {self.output_file}")
         except Exception as e:
             print(f"Error saving results: {str(e)}")
 
+    def close(self):
+        """Close the output and completed-URLs file handles"""
+        for fh in (self._out_fh, self._completed_fh):
+            if fh is not None:
+                fh.close()
+        self._out_fh = None
+        self._completed_fh = None
+
     def get_season_key(self, season: str, year: int, content_type: str) -> str:
         """Generate unique key for a season"""
         return f"{season}-{year}-{content_type}"
 
-    def fetch_page_content(self, url: str, max_retries: int = 3, base_delay: float = 3.0) -> str:
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create a keep-alive session whose connection pool matches max_concurrency"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency * 2,
+            limit_per_host=self.max_concurrency,
+            keepalive_timeout=30,
+        )
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+
+    def cache_path(self, url: str) -> str:
+        """Path of the gzipped on-disk copy of a page"""
+        return os.path.join(self.cache_dir, f"{hashlib.sha1(url.encode()).hexdigest()}.html.gz")
+
+    def read_cached_page(self, url: str) -> bytes:
+        """Return the cached page for url if it is fresh enough, otherwise None"""
+        path = self.cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) < self.cache_ttl:
+                with gzip.open(path, 'rb') as f:
+                    return f.read()
+        except (OSError, EOFError):
+            pass
+        return None
+
+    def write_cached_page(self, url: str, content: bytes):
+        """Store a fetched page in the on-disk cache"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(self.cache_path(url), 'wb', compresslevel=5) as f:
+                f.write(content)
+        except OSError as e:
+            print(f"Error caching {url}: {str(e)}")
+
+    async def fetch_page_content(self, session: aiohttp.ClientSession, url: str, max_retries: int = 3, base_delay: float = 3.0) -> bytes:
         """
-        Fetch HTML content from given URL with retry logic and exponential backoff
+        Fetch raw HTML bytes from given URL with retry logic and exponential backoff
+        
+        Requests go through the host rate limiter, which bounds concurrency and
+        only delays when livechart's rate-limit headers ask for it; 5xx responses
+        are retried with exponential backoff.
         
         Args:
+            session: aiohttp session to issue the request with (see create_session)
             url: The URL to fetch
             max_retries: Maximum number of retry attempts
             base_delay: Base delay between attempts in seconds
         """
+        cached = await asyncio.to_thread(self.read_cached_page, url)
+        if cached is not None:
+            return cached
+
         for attempt in range(max_retries):
             try:
-                # Add randomized delay between requests
+                # Back off before retrying a failed attempt
                 if attempt > 0:
                     delay = base_delay * (2 ** attempt) + random.uniform(0.1, 1.0)
                     print(f"Waiting {delay:.2f} seconds before retry {attempt + 1}")
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 
-                response = requests.get(url, headers=self.headers)
-                
-                # If we get rate limited, wait and retry
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', base_delay))
-                    print(f"Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    continue
-                
-                response.raise_for_status()
-                return response.text
+                async with self.rate_limiter:
+                    async with session.get(url) as response:
+                        # If we get rate limited, every request waits until the limiter allows it
+                        if response.status == 429:
+                            self.rate_limiter.update(response.headers, default_retry_after=base_delay)
+                            print(f"Rate limited on {url}, backing off...")
+                            continue
+                        
+                        self.rate_limiter.update(response.headers)
+                        response.raise_for_status()
+                        content = await response.read()
+
+                await asyncio.to_thread(self.write_cached_page, url, content)
+                return content
                 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 if attempt == max_retries - 1:  # Last attempt
                     raise AnimeScraperError(f"Failed to fetch page {url}: {str(e)}")
                 print(f"Attempt {attempt + 1} failed: {str(e)}")
                 continue
 
-    def convert_timestamp_to_utc(self, timestamp: str) -> str:
-        """Convert Unix timestamp to UTC datetime format"""
-        try:
-            return datetime.utcfromtimestamp(int(timestamp)).strftime('%Y-%m-%d %H:%M:%S UTC')
-        except (ValueError, TypeError):
-            return None
-
-    def extract_page_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract detailed information from anime page"""
-        try:
-            titles = self.extract_titles(soup)
-            premiere_season = self.extract_premiere_and_season(soup)
-            
-            page_content = {
-                'jp_title': titles['jp_title'],
-                'title': titles['title'],
-                'airing_time': self.extract_airing_time(soup),
-                'episodes': self.extract_episodes(soup),
-                'episode_number': self.extract_episode_number(soup),
-                'run_time': self.extract_run_time(soup),
-                'status': self.extract_status(soup),
-                'premiere': premiere_season['premiere'],
-                'season': premiere_season['season'],
-                'format': self.extract_format(soup),
-            }
-            
-            # # Remove None values
-            # page_content = {k: v for k, v in page_content.items() if v is not None}
-            
-            return page_content
-            
-        except Exception as e:
-            print(f"Error extracting page content: {str(e)}")
-            return {}
-
-    def extract_titles(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """
-        Extract both Japanese and English titles
-        
-        Logic:
-        1. Get main name from schema as jp_title
-        2. From alternateName array:
-           - If array has entries, first entry is English title
-           - If no array or empty, fallback to jp_title
-        3. Fallback to HTML parsing if schema fails
-        """
-        titles = {
-            'jp_title': None,
-            'title': None
-        }
-        
-        try:
-            script_tag = soup.find('script', {'type': 'application/ld+json'})
-            if script_tag and script_tag.string:
-                data = json.loads(script_tag.string)
-                
-                # Get Japanese title from main name
-                titles['jp_title'] = data.get('name')
-                
-                # Handle alternate names array
-                alternate_names = data.get('alternateName', [])
-                if isinstance(alternate_names, list) and len(alternate_names) > 1:
-                    titles['title'] = alternate_names[0]  # First entry is English title
-                else:
-                    titles['title'] = titles['jp_title']  # Fallback to Japanese title
-
-            # Fallback to HTML parsing if schema data isn't available or incomplete
-            if not titles['jp_title'] or not titles['title']:
-                title_divs = soup.find_all('div', {'class': 'text-xl'})
-                for div in title_divs:
-                    if div.find('span', {'class': 'text-base-content'}):
-                        titles['title'] = div.find('span', {'class': 'text-base-content'}).text.strip()
-                    elif 'text-base-content' in div.get('class', []):
-                        titles['jp_title'] = div.text.strip()
-                
-                # If still missing title, use jp_title as fallback
-                if not titles['title'] and titles['jp_title']:
-                    titles['title'] = titles['jp_title']
-
-        except (json.JSONDecodeError, AttributeError) as e:
-            print(f"Error extracting titles: {str(e)}")
-            pass
-        
-        return titles
-
-    def extract_mal_id(self, soup: BeautifulSoup) -> str:
-        """Extract MAL ID from MyAnimeList URL"""
-        try:
-            # Try to find MAL link with different possible classes
-            mal_link = soup.find('a', {'class': 'mal-icon'}) or \
-                      soup.find('a', {'class': 'lc-btn-myanimelist'})
-                      
-            if mal_link and 'href' in mal_link.attrs:
-                match = re.search(r'/(\d+)(?:/|$)', mal_link['href'])
-                if match:
-                    return match.group(1)
-        except AttributeError:
-            pass
-        return None
-
-    def extract_airing_time(self, soup: BeautifulSoup) -> str:
-        """Extract and convert airing timestamp"""
-        try:
-            countdown_div = soup.find('div', {'data-controller': 'countdown-bar'})
-            if countdown_div and 'data-countdown-bar-timestamp' in countdown_div.attrs:
-                timestamp = countdown_div['data-countdown-bar-timestamp']
-                return self.convert_timestamp_to_utc(timestamp)
-        except AttributeError:
-            pass
-        return None
-
-    def extract_episodes(self, soup: BeautifulSoup) -> str:
-        """Extract total episodes information"""
-        try:
-            grid_items = soup.find_all('div', {'class': 'whitespace-nowrap'})
-            for item in grid_items:
-                if 'Episodes' in item.text:
-                    episodes_span = item.find_next('div', {'class': 'flex'})
-                    if episodes_span:
-                        text = episodes_span.text.strip()
-                        return text if '/' in text else f"0/{text}"
-            
-            episode_span = soup.find('span', {'class': 'whitespace-pre'})
-            if episode_span and episode_span.text:
-                episodes_text = episode_span.text.strip()
-                if '/' in episodes_text:
-                    return episodes_text.strip()
-        except AttributeError:
-            pass
-        return "0/0"
-
-    def extract_episode_number(self, soup: BeautifulSoup) -> int:
-        """Extract current episode number from the details page"""
-        try:
-            # Look for the episode number in the schedules link text
-            schedule_link = soup.find('a', {'class': 'line-clamp-1'})
-            if schedule_link:
-                episode_span = schedule_link.find('span', {'class': 'font-medium'})
-                if episode_span:
-                    episode_text = episode_span.text.strip()
-                    match = re.search(r'EP(\d+)', episode_text)
-                    if match:
-                        return int(match.group(1))
-                        
-            # Backup method: look in the release-schedule-info div
-            schedule_info = soup.find('div', {'class': 'release-schedule-info'})
-            if schedule_info:
-                episode_text = schedule_info.text.strip()
-                match = re.search(r'EP(\d+)', episode_text)
-                if match:
-                    return int(match.group(1))
-
-        except (AttributeError, ValueError) as e:
-            print(f"Error extracting episode number: {str(e)}")
-        
-        return None
-
-    def extract_run_time(self, soup: BeautifulSoup) -> str:
-        """Extract runtime information"""
-        try:
-            # Find the specific div with class that contains 'whitespace-nowrap' and text "Run time"
-            runtime_label = soup.find('div', {'class': 'text-xs text-base-content/75 whitespace-nowrap', 'string': 'Run time'})
-            
-            if runtime_label:
-                parent = runtime_label.parent
-                if parent:
-                    # Get all text from parent and remove "Run time"
-                    return parent.get_text(strip=True).replace('Run time', '').strip()
-            
-            # Alternative method if above fails
-            grid_container = soup.find('div', class_='grid grid-flow-col auto-cols-fr w-full text-center mb-8 gap-2')
-            if grid_container:
-                cells = grid_container.find_all('div', recursive=False)
-                for cell in cells:
-                    label = cell.find('div', string='Run time')
-                    if label:
-                        # Get text content excluding the label
-                        return cell.get_text(strip=True).replace('Run time', '').strip()
-
-        except AttributeError:
-            pass
-        return None
-
-    def extract_status(self, soup: BeautifulSoup) -> str:
-        """Extract status information"""
-        try:
-            # Try schema.org data first
-            script_tag = soup.find('script', {'type': 'application/ld+json'})
-            if script_tag and script_tag.string:
-                import json
-                data = json.loads(script_tag.string)
-                if data.get('url', '').endswith('/11908'):  # Verify we have the right data
-                    return 'releasing'  # Status is not in schema, but we know it's releasing
-            
-            # Fallback to HTML parsing
-            status_label = soup.find('div', class_='text-sm', text='Status')
-            if status_label:
-                status_tag = status_label.find_next_sibling(text=True)
-                return status_tag.strip() if status_tag else "Unknown"
-        except (json.JSONDecodeError, AttributeError):
-            pass
-        return "Unknown"
-
-    def extract_premiere_and_season(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract premiere date and season"""
-        info = {
-            'premiere': None,
-            'season': None
-        }
-        
-        try:
-            # Find the premiere date
-            premiere_link = soup.find('a', {'class': 'link link-hover', 'href': re.compile(r'/schedule\?date=')})
-            if premiere_link:
-                date_str = premiere_link.text.strip()  # e.g. "Dec 11, 2023"
-                
-                # Parse the date string into a datetime object
-                date_obj = datetime.strptime(date_str, '%b %d, %Y')
-                
-                # Since the site typically lists dates for Japanese releases,
-                # assume JST (UTC+9) and convert to UTC
-                jst = pytz.timezone('Asia/Tokyo')
-                date_jst = jst.localize(date_obj)
-                date_utc = date_jst.astimezone(pytz.UTC)
-                
-                # Format as ISO 8601 UTC string
-                info['premiere'] = date_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
-            
-            # Find the season
-            season_link = soup.find('a', {'class': 'link link-hover', 'href': re.compile(r'/[a-z]+-\d{4}/')})
-            if season_link:
-                info['season'] = season_link.text.strip()
-
-        except (AttributeError, ValueError):
-            pass
-        
-        return info
+        raise AnimeScraperError(f"Failed to fetch page {url}: still rate limited after {max_retries} attempts")
 
-    def extract_format(self, soup: BeautifulSoup) -> str:
-        """Extract anime format"""
-        try:
-            # This is the container with all metadata including format
-            stats_container = soup.find('div', class_='grid grid-flow-col auto-cols-fr w-full text-center mb-8 gap-2')
-            if stats_container:
-                # Look through each div in the container
-                for div in stats_container.find_all('div', recursive=False):
-                    # Find the format label div
-                    format_label = div.find('div', text='Format')
-                    if format_label:
-                        # The format value will be in the next sibling div
-                        format_value_div = format_label.find_next_sibling()
-                        if format_value_div:
-                            return format_value_div.text.strip()
-                        # If no next sibling, get parent's text excluding 'Format'
-                        return div.get_text(strip=True).replace('Format', '').strip()
-
-        except AttributeError:
-            pass
-        
-        return None
+    def parse_anime_details(self, html_content: bytes) -> Dict[str, Any]:
+        """Parse an anime detail page into page content and MAL ID"""
+        return parse_anime_details(html_content)
 
-    def extract_anime_urls(self, html_content: str) -> List[Dict[str, str]]:
+    def extract_anime_urls(self, html_content: bytes) -> List[Dict[str, str]]:
         """Extract anime URLs and basic info from season page"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        anime_articles = soup.find_all('article', class_='anime')
-        
-        anime_data = []
-        for article in anime_articles:
-            try:
-                livechart_id = article.get('data-anime-id')
-                title = article.get('data-romaji')
-                if not title:
-                    title_elem = article.find('h3', class_='main-title')
-                    title = title_elem.text.strip() if title_elem else None
-
-                url_elem = article.find('a', href=True)
-                relative_url = url_elem['href'] if url_elem else None
-                full_url = f"{self.base_url}{relative_url}" if relative_url else None
-
-                # Extract airing timestamp
-                countdown_div = article.find('div', {'data-controller': 'countdown-bar'})
-                airing_time = None
-                if countdown_div and 'data-countdown-bar-timestamp' in countdown_div.attrs:
-                    airing_time = countdown_div['data-countdown-bar-timestamp']
-
-                # Get MAL ID
-                mal_id = self.extract_mal_id(article)
-
-                anime_data.append({
-                    'title': title,
-                    'livechart_url': full_url,
-                    'livechart_id': livechart_id,
-                    'mal_id': mal_id,
-                    'airing_time': self.convert_timestamp_to_utc(airing_time) if airing_time else None
-                })
-
-            except Exception as e:
-                print(f"Error processing article: {str(e)}")
-                continue
-
-        return anime_data
+        return extract_anime_urls(html_content, self.base_url)
 
-    def scrape_anime_details(self, url: str) -> Dict[str, Any]:
+    async def scrape_anime_details(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
         """Scrape detailed information from individual anime page"""
         try:
-            html_content = self.fetch_page_content(url)
-            soup = BeautifulSoup(html_content, 'html.parser')
-            page_content = self.extract_page_content(soup)
-            
-            # Extract MAL ID from the details page
-            mal_id = self.extract_mal_id(soup)  # This will be more reliable
-            
-            return {
-                'page_content': page_content,
-                'mal_id': mal_id
-            }
+            html_content = await self.fetch_page_content(session, url)
+            # Parsing is CPU-bound, keep it off the event loop (and the GIL)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.parse_pool, parse_anime_details, html_content)
         except Exception as e:
             print(f"Error scraping anime details from {url}: {str(e)}")
             return None
 
-    def scrape_season(self, season_url: str) -> List[Dict[str, Any]]:
-        """Main function to scrape entire season"""
+    async def scrape_season(self, session: aiohttp.ClientSession, season_url: str, completed_urls: set = frozenset()) -> List[Dict[str, Any]]:
+        """Main function to scrape entire season, skipping anime whose URL is in completed_urls"""
         try:
             # First get the season page
-            html_content = self.fetch_page_content(season_url)
-            anime_list = self.extract_anime_urls(html_content)
+            html_content = await self.fetch_page_content(session, season_url)
+            loop = asyncio.get_running_loop()
+            anime_list = await loop.run_in_executor(self.parse_pool, extract_anime_urls, html_content, self.base_url)
+            # Keyed by URL so an anime listed twice on the page is only fetched once
+            anime_list = list({
+                anime['livechart_url']: anime for anime in anime_list
+                if anime['livechart_url'] and anime['livechart_url'] not in completed_urls
+            }.values())
+
+            # Now scrape all anime pages concurrently, bounded by the rate limiter
+            details_list = await asyncio.gather(
+                *(self.scrape_anime_details(session, anime['livechart_url']) for anime in anime_list)
+            )
 
-            # Now scrape each anime page
             final_results = []
-            for anime in anime_list:
+            for anime, details in zip(anime_list, details_list):
                 try:
                     if anime['livechart_url']:
-                        # Get details from anime page
-                        details = self.scrape_anime_details(anime['livechart_url'])
-                        
                         # Merge master and details data
                         merged_entry = {
                             'livechart_url': anime['livechart_url'],
@@ -479,11 +737,6 @@ class LivechartScraper:
                             merged_entry['mal_id'] = details_mal_id or master_mal_id or None
                         
                         final_results.append(merged_entry)
-                        
-                        # Add randomized delay between 1-2 seconds
-                        delay = random.uniform(1, 2)
-                        print(f"Waiting {delay:.2f} seconds before next request...")
-                        time.sleep(delay)
                 except Exception as e:
                     print(f"Error processing anime {anime.get('title', 'Unknown')}: {str(e)}")
                     continue
@@ -529,11 +782,13 @@ class LivechartScraper:
             print(f"Error merging data: {str(e)}")
             return master_data  # Return original data if merge fails
 
-def main():
+async def main_async():
     scraper = LivechartScraper()
+    scraper.parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    session = scraper.create_session()
 
     # Load existing data and progress
-    all_results, progress = scraper.load_existing_data()
+    total_entries, progress = scraper.load_existing_data()
     completed_urls = progress['completed']
     last_position = progress['last_position']
     
@@ -563,49 +818,50 @@ def main():
                     print(f"\nScraping {season.capitalize()} {year} {content_type}...")
                     
                     try:
-                        results = scraper.scrape_season(season_url)
+                        results = await scraper.scrape_season(session, season_url, completed_urls)
                         
                         # Process results and update completed URLs
-                        for entry in results:
-                            if entry['livechart_url'] not in completed_urls:
-                                entry['scrape_info'] = {
-                                    'season': season.capitalize(),
-                                    'year': year,
-                                    'content_type': content_type
-                                }
-                                all_results.append(entry)
-                                completed_urls.add(entry['livechart_url'])
+                        new_entries = [entry for entry in results if entry['livechart_url'] not in completed_urls]
+                        scrape_info = {
+                            'season': season.capitalize(),
+                            'year': year,
+                            'content_type': content_type
+                        }
+                        for entry in new_entries:
+                            entry['scrape_info'] = dict(scrape_info)
+                        completed_urls.update(entry['livechart_url'] for entry in new_entries)
                         
                         # Save progress after each season
-                        scraper.save_progress(completed_urls, current_position)
-                        scraper.save_results(all_results)
+                        scraper.append_entries(new_entries)
+                        scraper.mark_completed(entry['livechart_url'] for entry in new_entries)
+                        total_entries += len(new_entries)
+                        scraper.save_progress(current_position)
                         
                         print(f"Successfully scraped {len(results)} entries from {season.capitalize()} {year} {content_type}")
-                        print(f"Total entries so far: {len(all_results)}")
-                        
-                        # Add longer delay between seasons
-                        delay = random.uniform(5, 8)
-                        print(f"Waiting {delay:.2f} seconds before next season...")
-                        time.sleep(delay)
+                        print(f"Total entries so far: {total_entries}")
                         
                     except Exception as e:
                         print(f"Error scraping {season} {year}: {str(e)}")
                         # Save progress even on error
-                        scraper.save_progress(completed_urls, current_position)
-                        scraper.save_results(all_results)
+                        scraper.save_progress(current_position)
                         continue
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\nScraping interrupted by user. Saving progress...")
-        scraper.save_progress(completed_urls, current_position)
-        scraper.save_results(all_results)
+        scraper.save_progress(current_position)
         print("Progress saved. You can resume later.")
         return
+    finally:
+        await session.close()
+        scraper.parse_pool.shutdown()
+        scraper.close()
 
     # Final save
-    scraper.save_progress(completed_urls, current_position)
-    scraper.save_results(all_results)
-    print(f"\nScraping completed! Total entries: {len(all_results)}")
+    scraper.save_progress(current_position)
+    print(f"\nScraping completed! Total entries: {total_entries}")
+
+def main():
+    asyncio.run(main_async())
 
 if __name__ == "__main__":
     main()
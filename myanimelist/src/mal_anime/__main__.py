@@ -1,9 +1,15 @@
 import logging
 import argparse
 import yaml
-import json
+import orjson
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any
+from collections import deque
+from typing import Dict, Any, Iterable, Iterator
 
 from .scraper import (
     MALUrlGenerator,
@@ -13,6 +19,16 @@ from .scraper import (
     MALAnimeScraper,
 )
 from .config import DEFAULT_OUTPUT_FILE
+from .retry import HostRateLimiter
+
+MAX_WORKERS = 8
+# Scrapes submitted ahead of the one being written, bounding memory for long ID lists
+MAX_PENDING = MAX_WORKERS * 4
+
+# One scraper per worker thread, reused across all the IDs that thread handles
+_thread_local = threading.local()
+# Shared by every thread's scraper so the pool as a whole respects the rate limit
+_limiter = HostRateLimiter()
 
 
 def setup_logging():
@@ -33,6 +49,12 @@ def parse_args():
         default="src/mal_anime/config/config.yaml",
         help="Config file path",
     )
+    parser.add_argument(
+        "-i",
+        "--ids-file",
+        type=str,
+        help="File with one MAL ID per line ('-' for stdin), read as scraping proceeds",
+    )
     parser.add_argument(
         "-o", "--output", type=str, default="output/data.jsonl", help="Output file path"
     )
@@ -48,11 +70,75 @@ def load_config(config_path: str) -> Dict:
     }
 
 
-def write_records(records: List[Dict], output_path: str):
-    with open(output_path, "w", encoding="utf-8") as f:
-        for record in records:
-            # Write each record as single line
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+def read_id_file(path: str) -> Iterator[int]:
+    # IDs are read while output is already streaming, so a bad line is
+    # skipped rather than aborting the run with a truncated output file
+    with nullcontext(sys.stdin) if path == "-" else open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                mal_id = int(line)
+            except ValueError:
+                logging.error(
+                    "Skipping invalid MAL ID on line %d of %s: %r", line_number, path, line
+                )
+                continue
+            yield mal_id
+
+
+def write_records(records: Iterable[Dict], output_path: str):
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        # orjson emits UTF-8 bytes directly; one record per line
+        f.writelines(orjson.dumps(record) + b"\n" for record in records)
+
+
+def build_scraper() -> MALAnimeScraper:
+    data_scraper = MALScraper(_limiter)
+    return MALAnimeScraper(
+        url_generator=MALUrlGenerator(),
+        data_scraper=data_scraper,
+        data_transformer=MALDataTransformer(data_scraper),
+        data_storage=JSONDataStorage(),
+    )
+
+
+def get_thread_scraper() -> MALAnimeScraper:
+    # Not shared across threads: MALDataTransformer keeps per-ID state
+    scraper = getattr(_thread_local, "scraper", None)
+    if scraper is None:
+        scraper = _thread_local.scraper = build_scraper()
+    return scraper
+
+
+def scrape_one(mal_id: int) -> Dict[str, Any]:
+    logging.info("Scraping MAL ID: %s", mal_id)
+    return get_thread_scraper().scrape(mal_id)
+
+
+def iter_results(
+    executor: ThreadPoolExecutor, mal_ids: Iterable[int]
+) -> Iterator[Dict[str, Any]]:
+    # Keep a bounded window of submitted scrapes, so IDs are read lazily and
+    # scraping starts before the whole list has been parsed. Results are
+    # collected in input order so the output file is deterministic.
+    ids = iter(mal_ids)
+    futures = deque(
+        (mal_id, executor.submit(scrape_one, mal_id))
+        for mal_id in islice(ids, MAX_PENDING)
+    )
+    while futures:
+        mal_id, future = futures.popleft()
+        for next_id in islice(ids, 1):
+            futures.append((next_id, executor.submit(scrape_one, next_id)))
+        try:
+            record = future.result()
+        except Exception as e:
+            logging.error(f"Error scraping MAL ID {mal_id}: {e}")
+            continue
+        logging.info("Successfully scraped data for ID: %s", mal_id)
+        yield record
 
 
 def main():
@@ -72,7 +158,7 @@ def main():
     if args.mal_ids:
         mal_ids.extend(args.mal_ids)
 
-    if not mal_ids:
+    if not mal_ids and not args.ids_file:
         raise ValueError("No MAL IDs provided via config or command line")
 
     # Use output path from: CLI arg (if provided) -> config -> default
@@ -84,25 +170,14 @@ def main():
     logging.debug("Starting MAL Anime Scraper")
     logging.info(f"Starting scraping for MAL IDs: {mal_ids}")
 
-    scraper = MALAnimeScraper(
-        url_generator=MALUrlGenerator(),
-        data_scraper=MALScraper(),
-        data_transformer=MALDataTransformer(),
-        data_storage=JSONDataStorage(),
-    )
-
-    records = []
-    for mal_id in mal_ids:
-        logging.info(f"Scraping MAL ID: {mal_id}")
-        try:
-            record = scraper.scrape(mal_id)
-            records.append(record)
-            logging.info(f"Successfully scraped data for ID: {mal_id}")
-        except Exception as e:
-            logging.error(f"Error scraping MAL ID {mal_id}: {e}")
-
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    scraper.data_storage.store_all(records, output_path)
+    all_ids = (
+        chain(mal_ids, read_id_file(args.ids_file)) if args.ids_file else mal_ids
+    )
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Stream records to the output file as they finish instead of
+        # holding every record in a list until the end
+        write_records(iter_results(executor, all_ids), output_path)
     logging.info(f"Scraping completed. Data saved to {output_path}")
 
 
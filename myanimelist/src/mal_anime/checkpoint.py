@@ -0,0 +1,257 @@
+# src/mal_anime/checkpoint.py
+
+import asyncio
+import atexit
+import logging
+import mmap
+import os
+import threading
+import orjson
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+
+class CheckpointHandler:
+    """
+    Handles saving and loading checkpoint state for a paginated MAL scraper.
+    Tracks which IDs have been successfully processed and the pagination state.
+    Subclasses set `kind`, which names the scraper in log messages.
+    """
+
+    kind = "scraper"
+
+    # Initial bitmap size: 8M IDs, well past the current max MAL ID
+    BITMAP_SIZE = 1 << 20
+    # Longest a change waits for a background save while a scrape is running
+    FLUSH_INTERVAL = 30.0
+    # How often the background flusher checks whether a save is due
+    FLUSH_POLL_INTERVAL = 1.0
+
+    def __init__(self, checkpoint_file: str):
+        self.checkpoint_file = checkpoint_file
+        # Completed IDs as a bitmap: bit i is set once ID i is processed.
+        # The bitmap lives in a memory-mapped file, so marking an ID is a
+        # single byte update that the kernel writes back on its own.
+        self.bits_file = self.bits_path(checkpoint_file)
+        # The previous generation of the checkpoint, kept in case the latest is unreadable
+        self.backup_file = f"{checkpoint_file}.bak"
+        self._mm: Optional[mmap.mmap] = None
+        self._completed_count = 0
+        # Pagination state: which letter and page we're currently on
+        self.current_letter: Optional[str] = None
+        self.current_page: int = 0
+        # Set whenever there is state the last save did not cover
+        self._dirty = False
+        # Completed count as of the last save, for count-based flushing
+        self._saved_count = 0
+        # A background save may still be running when the final one starts
+        self._save_lock = threading.Lock()
+        self.load_checkpoint()
+        # Make sure whatever the background flusher has not saved yet still
+        # reaches disk if the process exits without calling close()
+        atexit.register(self.close)
+
+    @staticmethod
+    def bits_path(checkpoint_file: str) -> str:
+        """Path of the bitmap file that sits next to the pagination JSON."""
+        return str(Path(checkpoint_file).with_suffix(".bits"))
+
+    @staticmethod
+    def delete_files(checkpoint_file: str) -> bool:
+        """Remove the checkpoint, its backup and its bitmap; returns whether anything was deleted."""
+        deleted = False
+        for path in (
+            Path(checkpoint_file),
+            Path(f"{checkpoint_file}.bak"),
+            Path(CheckpointHandler.bits_path(checkpoint_file)),
+        ):
+            if path.exists():
+                path.unlink()
+                deleted = True
+        return deleted
+
+    def load_checkpoint(self) -> None:
+        """
+        Load the checkpoint file if it exists.
+
+        Falls back to the previous generation if the latest checkpoint is
+        corrupt, and raises if neither is readable rather than discarding
+        progress and re-scraping everything.
+        """
+        self._open_bitmap()
+        checkpoint_data = self._read_checkpoint()
+        if checkpoint_data is not None:
+            self._import_legacy_ids(checkpoint_data)
+            self.current_letter = checkpoint_data.get("current_letter")
+            self.current_page = checkpoint_data.get("current_page", 0)
+            logging.info(
+                f"Loaded {self.kind} checkpoint with {self.get_completed_count()} completed IDs, "
+                f"position: letter={self.current_letter}, page={self.current_page}"
+            )
+        else:
+            logging.info(f"No {self.kind} checkpoint file found, starting fresh")
+        self._saved_count = self._completed_count
+
+    def _read_checkpoint(self) -> Optional[dict]:
+        error: Optional[orjson.JSONDecodeError] = None
+        for path in (self.checkpoint_file, self.backup_file):
+            try:
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
+            except FileNotFoundError:
+                pass
+            except orjson.JSONDecodeError as e:
+                logging.error(f"Corrupt {self.kind} checkpoint file {path}: {e}")
+                error = error or e
+        if error is not None:
+            raise error
+        return None
+
+    def _open_bitmap(self) -> None:
+        fd = os.open(self.bits_file, os.O_RDWR | os.O_CREAT)
+        try:
+            size = max(os.fstat(fd).st_size, self.BITMAP_SIZE)
+            os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size, flags=mmap.MAP_SHARED, prot=mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            # The mapping keeps its own reference to the file
+            os.close(fd)
+        self._completed_count = int.from_bytes(self._mm, "little").bit_count()
+
+    def _import_legacy_ids(self, checkpoint_data: dict) -> None:
+        # Checkpoints written before the bitmap listed completed IDs in the JSON
+        self._set_bits(checkpoint_data.get("completed_ids", []))
+
+    def save_checkpoint(self) -> None:
+        """Save the current checkpoint state."""
+        self._dirty = False
+        self._write_checkpoint(self.current_letter, self.current_page)
+
+    async def flush_async(self) -> None:
+        """Save the checkpoint in a worker thread if anything changed since the last save."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Snapshot the position on the loop so the thread sees a consistent pair
+        await asyncio.to_thread(
+            self._write_checkpoint, self.current_letter, self.current_page
+        )
+
+    async def run_flusher(self, save_every: Optional[int] = None) -> None:
+        """
+        Save the checkpoint in the background until cancelled.
+
+        Changes are coalesced: a save happens once `save_every` more IDs have
+        been completed, or FLUSH_INTERVAL seconds after the last save,
+        whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+        while True:
+            await asyncio.sleep(self.FLUSH_POLL_INTERVAL)
+            count_due = (
+                save_every is not None
+                and self._completed_count - self._saved_count >= save_every
+            )
+            if count_due or loop.time() - last_flush >= self.FLUSH_INTERVAL:
+                await self.flush_async()
+                last_flush = loop.time()
+
+    def _write_checkpoint(self, letter: Optional[str], page: int) -> None:
+        with self._save_lock:
+            self._write_checkpoint_locked(letter, page)
+
+    def _write_checkpoint_locked(self, letter: Optional[str], page: int) -> None:
+        try:
+            # The bitmap is only synced when the checkpoint is saved
+            saved_count = self._completed_count
+            self._mm.flush()
+            # Write a sibling temp file and rename it over the checkpoint, so a
+            # crash mid-write never leaves a truncated file behind
+            tmp_file = f"{self.checkpoint_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        {
+                            "current_letter": letter,
+                            "current_page": page,
+                        }
+                    )
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            # Keep the previous generation as a fallback for load_checkpoint
+            if os.path.exists(self.checkpoint_file):
+                os.replace(self.checkpoint_file, self.backup_file)
+            os.replace(tmp_file, self.checkpoint_file)
+            self._saved_count = saved_count
+            logging.debug(
+                f"{self.kind.capitalize()} checkpoint saved: {self.get_completed_count()} IDs, "
+                f"position: letter={letter}, page={page}"
+            )
+        except Exception as e:
+            logging.error(f"Error saving {self.kind} checkpoint file: {e}")
+
+    def mark_completed(self, item_id: int) -> None:
+        """Mark an ID as successfully processed."""
+        byte, bit = divmod(item_id, 8)
+        if byte >= len(self._mm):
+            self._grow(byte + 1)
+        mm = self._mm
+        value = mm[byte]
+        if not value & (1 << bit):
+            mm[byte] = value | (1 << bit)
+            self._completed_count += 1
+            self._dirty = True
+
+    def _set_bits(self, ids: Iterable[int]) -> None:
+        for id_ in ids:
+            self.mark_completed(id_)
+
+    def _grow(self, needed: int) -> None:
+        # Double the mapping until the ID fits; rare, since the initial
+        # size already covers far more IDs than MAL has
+        size = len(self._mm)
+        while size < needed:
+            size *= 2
+        self._mm.resize(size)
+
+    def close(self) -> None:
+        """Save any pending state, then sync and unmap the bitmap."""
+        if self._mm is None:
+            return
+        if self._dirty:
+            self.save_checkpoint()
+        self._mm.flush()
+        self._mm.close()
+        self._mm = None
+        atexit.unregister(self.close)
+
+    def update_pagination(self, letter: str, page: int) -> None:
+        """Update the current pagination position; the background flusher saves it."""
+        self.current_letter = letter
+        self.current_page = page
+        self._dirty = True
+
+    def is_completed(self, item_id: int) -> bool:
+        """Check if an ID has already been successfully processed."""
+        byte, bit = divmod(item_id, 8)
+        return byte < len(self._mm) and bool(self._mm[byte] & (1 << bit))
+
+    def completed_among(self, item_ids: Iterable[int]) -> Set[int]:
+        """Return which of item_ids were already processed, checking a whole batch at once."""
+        mm = self._mm
+        size = len(mm)
+        return {
+            item_id
+            for item_id in item_ids
+            if (item_id >> 3) < size and mm[item_id >> 3] & (1 << (item_id & 7))
+        }
+
+    def get_pagination_state(self) -> tuple:
+        """Get the current pagination state (letter, page)."""
+        return self.current_letter, self.current_page
+
+    def get_completed_count(self) -> int:
+        """Get the count of completed IDs."""
+        return self._completed_count
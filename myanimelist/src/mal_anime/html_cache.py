@@ -0,0 +1,46 @@
+# src/mal_anime/html_cache.py
+
+import gzip
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+
+class HTMLCache:
+    """
+    Keeps a gzipped copy of every fetched page on disk, keyed by URL, so a
+    rerun (e.g. after a transformer change) can skip the network.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        # Fan out over 256 subdirectories to keep each one small
+        return self.cache_dir / key[:2] / f"{key}.html.gz"
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for url, or None on a miss."""
+        try:
+            with gzip.open(self._path(url), "rb") as f:
+                return f.read()
+        except (OSError, EOFError):
+            # Missing or unreadable entries are refetched and overwritten
+            return None
+
+    def put(self, url: str, html: bytes) -> None:
+        """Cache the body for url; a failed write only costs a refetch later."""
+        path = self._path(url)
+        # Unique temp name, so concurrent writers of one URL never mix bytes
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(gzip.compress(html))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Failed to cache {url}: {e}")
+            temp_path.unlink(missing_ok=True)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any
 
@@ -14,8 +15,15 @@ class IDataScraper(ABC):
     def scrape(self, url: str) -> Dict[str, Any]:
         pass
 
+    async def scrape_async(self, url: str, session: Any) -> Dict[str, Any]:
+        """Scrape without blocking the event loop; session is an open aiohttp session"""
+        return await asyncio.to_thread(self.scrape, url)
+
 
 class IDataTransformer(ABC):
+    # Lets transformers that define __slots__ skip the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def transform(
         self, raw_data: Dict[str, Any], mal_id: int
@@ -28,3 +36,11 @@ class IDataStorage(ABC):
     def store(self, data: Dict[str, Any], output_path: str) -> None:
         """Store data in specified format"""
         pass
+
+    def flush(self) -> None:
+        """Push buffered records to their destination"""
+        pass
+
+    def close(self) -> None:
+        """Release any open handles"""
+        pass
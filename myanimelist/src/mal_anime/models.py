@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimeDetails:
     id: int
     title: str
@@ -14,13 +14,14 @@ class AnimeDetails:
     streamingPlatforms: List[Dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimeRecord:
     _airbyte_ab_id: str
     _airbyte_emitted_at: int
     _airbyte_data: AnimeDetails
 
     def to_dict(self) -> Dict:
+        # A shallow literal: asdict would deep-copy microdata and leftSide
         return {
             "_airbyte_ab_id": self._airbyte_ab_id,
             "_airbyte_emitted_at": self._airbyte_emitted_at,
@@ -1,199 +1,386 @@
-import json
+import orjson
+import gzip
+import io
 import logging
+import posixpath
+import re
+import threading
 import time
 import uuid
 import aiohttp
 import requests
-from datetime import datetime
+from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 from .interfaces import IDataTransformer, IDataStorage
-from .retry import make_request
+from .retry import HostRateLimiter, make_request, make_request_async, make_session
 from .people_checkpoint import PeopleCheckpointHandler
+from .utils import HTML_PARSER, has_class, next_airbyte_id, paginate_people
 import asyncio
 
+# Labels of the "dark_text" spans on a person page that precede a plain value
+GIVEN_NAME_LABEL = "Given name:"
+FAMILY_NAME_LABEL = "Family name:"
+BIRTHDAY_LABEL = "Birthday:"
+MEMBER_FAVORITES_LABEL = "Member Favorites:"
+
+# Birthdays look like "Feb 25, 1989", sometimes with extra spaces
+BIRTHDAY_PATTERN = re.compile(r"([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})")
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+
+# Compiled once; lxml evaluates each selection in C instead of walking the
+# tree from Python the way nested find_all calls do
+# Single-element lookups ask for the first match only
+NAME_XPATH = etree.XPath(f"(//h1[{has_class('title-name')}])[1]")
+DARK_TEXT_XPATH = etree.XPath(f"//span[{has_class('dark_text')}]")
+MORE_XPATH = etree.XPath(f"(//div[{has_class('people-informantion-more')}])[1]")
+# The character, staff and manga tables are all found in one scan
+PEOPLE_TABLES_XPATH = etree.XPath("//table[contains(@class, 'js-table-people-')]")
+PEOPLE_TABLE_CLASS_PREFIX = "js-table-people-"
+ROWS_XPATH = etree.XPath(".//tr")
+CELLS_XPATH = etree.XPath(".//td")
+PEOPLE_TITLE_XPATH = etree.XPath(f".//a[{has_class('js-people-title')}]")
+SPACEIT_PAD_XPATH = etree.XPath(f".//div[{has_class('spaceit_pad')}]")
+ANCHOR_XPATH = etree.XPath(".//a")
+SMALL_XPATH = etree.XPath(".//small")
+
+class GCSDataStorage(IDataStorage):
+    # Concurrent uploads used by store_all
+    upload_workers = 16
 
-class GCSDataStorage:
     def __init__(self, bucket_name: str, project_id: str):
         self.client = storage.Client(project=project_id)
         self.bucket = self.client.bucket(bucket_name)
 
     def store(self, data: Dict[str, Any], file_path: str) -> None:
-        json_data = json.dumps(data)
+        json_data = orjson.dumps(data)
         blob = self.bucket.blob(file_path)
         blob.upload_from_string(data=json_data, content_type="application/json")
-        logging.info(f"Data stored to {file_path} in bucket {self.bucket.name}")
+        logging.info("Data stored to %s in bucket %s", file_path, self.bucket.name)
 
     def store_all(self, data_list: List[Dict[str, Any]], base_path: str) -> None:
-        for idx, data in enumerate(data_list):
-            file_path = f"{base_path}/item_{idx}.json"
-            self.store(data, file_path)
+        # Still one object per record, but uploaded concurrently rather than back to back
+        transfer_manager.upload_many(
+            [
+                (io.BytesIO(orjson.dumps(data)), self.bucket.blob(f"{base_path}/item_{idx}.json"))
+                for idx, data in enumerate(data_list)
+            ],
+            upload_kwargs={"content_type": "application/json"},
+            worker_type=transfer_manager.THREAD,
+            max_workers=self.upload_workers,
+            raise_exception=True,
+        )
         logging.info(
             f"Stored {len(data_list)} items in bucket {self.bucket.name} under {base_path}"
         )
 
 
+class GCSBatchedJSONLStorage(IDataStorage):
+    """Buffers records into gzipped JSONL shards so each GCS upload carries many records"""
+
+    # Concurrent shard uploads used by store_all
+    upload_workers = 16
+
+    def __init__(
+        self,
+        bucket_name: str,
+        project_id: str,
+        max_records: int = 1000,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.client = storage.Client(project=project_id)
+        self.bucket = self.client.bucket(bucket_name)
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._base_path = ""
+        # store() is called from several uploader threads at once
+        self._lock = threading.Lock()
+
+    def store(self, data: Dict[str, Any], file_path: str) -> None:
+        # Only buffers, so a stored record can't be lost to a failed upload;
+        # flush() uploads it. Records are grouped under the directory they
+        # would have been stored in.
+        line = orjson.dumps(data) + b"\n"
+        with self._lock:
+            self._base_path = posixpath.dirname(file_path)
+            self._buf.append(line)
+            self._buf_bytes += len(line)
+
+    def store_all(self, data_list: List[Dict[str, Any]], base_path: str) -> None:
+        # Cut every shard up front, then upload them concurrently
+        shards = self._cut_shards([orjson.dumps(data) + b"\n" for data in data_list])
+        transfer_manager.upload_many(
+            [self._shard_upload(base_path, shard) for shard in shards],
+            upload_kwargs={"content_type": "application/x-ndjson"},
+            worker_type=transfer_manager.THREAD,
+            max_workers=self.upload_workers,
+            raise_exception=True,
+        )
+        logging.info(
+            f"Stored {len(data_list)} records as {len(shards)} shards in bucket {self.bucket.name} under {base_path}"
+        )
+
+    def flush(self) -> None:
+        """Upload everything buffered, in shards of at most max_records records or max_bytes."""
+        with self._lock:
+            lines = self._take()
+        shards = self._cut_shards(lines)
+        for idx, shard in enumerate(shards):
+            try:
+                self._upload(shard)
+            except Exception:
+                # Put back this shard and the rest so the next flush retries them
+                unsent = [line for shard in shards[idx:] for line in shard]
+                with self._lock:
+                    self._buf[:0] = unsent
+                    self._buf_bytes += sum(map(len, unsent))
+                raise
+
+    def close(self) -> None:
+        self.flush()
+
+    def _cut_shards(self, lines: List[bytes]) -> List[List[bytes]]:
+        shards, shard, size = [], [], 0
+        for line in lines:
+            shard.append(line)
+            size += len(line)
+            if len(shard) >= self.max_records or size >= self.max_bytes:
+                shards.append(shard)
+                shard, size = [], 0
+        if shard:
+            shards.append(shard)
+        return shards
+
+    def _take(self) -> List[bytes]:
+        lines = self._buf
+        self._buf = []
+        self._buf_bytes = 0
+        return lines
+
+    def _shard_upload(self, base_path: str, lines: List[bytes]) -> tuple:
+        """Gzipped shard body and the blob it goes to, as transfer_manager pairs them."""
+        prefix = f"{base_path}/" if base_path else ""
+        blob = self.bucket.blob(f"{prefix}shard_{uuid.uuid4().hex}.jsonl.gz")
+        blob.content_encoding = "gzip"
+        return io.BytesIO(gzip.compress(b"".join(lines))), blob
+
+    def _upload(self, lines: List[bytes]) -> None:
+        if not lines:
+            return
+        body, blob = self._shard_upload(self._base_path, lines)
+        blob.upload_from_file(body, content_type="application/x-ndjson")
+        logging.info(
+            f"Stored {len(lines)} records to {blob.name} in bucket {self.bucket.name}"
+        )
+
+
 class VADataTransformer(IDataTransformer):
-    def __init__(self):
-        self.people_id = None
+    """Stateless, so one instance can be shared by any number of workers"""
 
     def transform(self, raw_data: Dict[str, Any], people_id: int) -> Dict[str, Any]:
-        self.mal_id = people_id
-        soup = BeautifulSoup(raw_data["html"], "html.parser")
+        tree = lxml.html.fromstring(raw_data["html"], parser=HTML_PARSER)
+        labels = self._index_dark_text(tree)
+        tables = self._index_tables(tree)
         transformed_data = {
-            "_airbyte_ab_id": str(uuid.uuid4()),
-            "_airbyte_emitted_at": int(time.time() * 1000),
+            "_airbyte_ab_id": next_airbyte_id(),
+            "_airbyte_emitted_at": time.time_ns() // 1_000_000,
             "_airbyte_data": {
                 "people_id": people_id,
                 "url": raw_data["url"],
-                "name": self._extract_name(soup),
-                "given_name": self._extract_given_name(soup),
-                "family_name": self._extract_family_name(soup),
-                "birthday": self._extract_birthday(soup),
-                "member_favorites": self._extract_member_favorites(soup),
-                "more": self._extract_more(soup),
-                "voice_acting_roles": self._extract_voice_acting_roles(soup),
-                "anime_staff_positions": self._extract_anime_staff_positions(soup),
-                "published_manga": self._extract_published_manga(soup),
+                "name": self._extract_name(tree),
+                "given_name": self._extract_given_name(labels),
+                "family_name": self._extract_family_name(labels),
+                "birthday": self._extract_birthday(labels),
+                "member_favorites": self._extract_member_favorites(labels),
+                "more": self._extract_more(tree),
+                "voice_acting_roles": self._extract_voice_acting_roles(
+                    tables.get("character")
+                ),
+                "anime_staff_positions": self._extract_anime_staff_positions(
+                    tables.get("staff")
+                ),
+                "published_manga": self._extract_published_manga(tables.get("manga")),
             },
         }
         return transformed_data
 
-    def _extract_name(self, soup: BeautifulSoup) -> Optional[str]:
-        name_tag = soup.find("h1", class_="title-name")
-        if name_tag:
-            return name_tag.text.strip()
+    @staticmethod
+    def _extract_name(tree: HtmlElement) -> Optional[str]:
+        name_tags = NAME_XPATH(tree)
+        if name_tags:
+            return name_tags[0].text_content().strip()
         return None
 
-    def _extract_given_name(self, soup: BeautifulSoup) -> str:
-        given_name_tag = soup.find("span", class_="dark_text", string="Given name:")
-        if given_name_tag and given_name_tag.next_sibling:
-            return given_name_tag.next_sibling.strip()
-        return ""
-
-    def _extract_family_name(self, soup: BeautifulSoup) -> str:
-        family_name_tag = soup.find("span", class_="dark_text", string="Family name:")
-        if family_name_tag and family_name_tag.next_sibling:
-            return family_name_tag.next_sibling.strip()
-        return ""
-
-    def _extract_birthday(self, soup: BeautifulSoup) -> Optional[str]:
-        birthday_tag = soup.find("span", class_="dark_text", string="Birthday:")
-        if birthday_tag and birthday_tag.next_sibling:
-            birthday_str = birthday_tag.next_sibling.strip()
-            try:
-                return datetime.strptime(birthday_str, "%b %d, %Y").strftime("%Y-%m-%d")
-            except ValueError:
-                try:
-                    return datetime.strptime(birthday_str, "%b  %d, %Y").strftime(
-                        "%Y-%m-%d"
-                    )
-                except ValueError:
-                    return None
-        return None
+    @staticmethod
+    def _index_dark_text(tree: HtmlElement) -> Dict[str, str]:
+        # One pass over the label spans instead of a tree walk per field.
+        # The value is the text right after the label span, i.e. its tail.
+        labels = {}
+        for label_tag in DARK_TEXT_XPATH(tree):
+            if len(label_tag) or label_tag.text is None:
+                continue
+            value = label_tag.tail
+            labels.setdefault(
+                label_tag.text.strip(), value.strip() if value is not None else None
+            )
+        return labels
+
+    @staticmethod
+    def _index_tables(tree: HtmlElement) -> Dict[str, HtmlElement]:
+        # Keyed by the class suffix ("character", "staff", "manga"); the first
+        # table of each kind wins, as a per-table find would have returned
+        tables = {}
+        for table in PEOPLE_TABLES_XPATH(tree):
+            for class_name in table.get("class", "").split():
+                if class_name.startswith(PEOPLE_TABLE_CLASS_PREFIX):
+                    tables.setdefault(class_name[len(PEOPLE_TABLE_CLASS_PREFIX):], table)
+        return tables
+
+    @staticmethod
+    def _extract_given_name(labels: Dict[str, str]) -> str:
+        return labels.get(GIVEN_NAME_LABEL) or ""
+
+    @staticmethod
+    def _extract_family_name(labels: Dict[str, str]) -> str:
+        return labels.get(FAMILY_NAME_LABEL) or ""
+
+    @staticmethod
+    def _extract_birthday(labels: Dict[str, str]) -> Optional[str]:
+        birthday_str = labels.get(BIRTHDAY_LABEL)
+        match = BIRTHDAY_PATTERN.fullmatch(birthday_str) if birthday_str else None
+        if not match:
+            return None
+        month = MONTHS.get(match.group(1).lower())
+        day, year = int(match.group(2)), int(match.group(3))
+        if month is None or not 1 <= year or not 1 <= day <= monthrange(year, month)[1]:
+            return None
+        return f"{year:04d}-{month:02d}-{day:02d}"
 
-    def _extract_member_favorites(self, soup: BeautifulSoup) -> Optional[int]:
-        favorites_tag = soup.find(
-            "span", class_="dark_text", string="Member Favorites:"
-        )
-        if favorites_tag and favorites_tag.next_sibling:
+    @staticmethod
+    def _extract_member_favorites(labels: Dict[str, str]) -> Optional[int]:
+        favorites_str = labels.get(MEMBER_FAVORITES_LABEL)
+        if favorites_str:
             try:
-                favorites_str = favorites_tag.next_sibling.strip().replace(",", "")
-                return int(favorites_str)
+                return int(favorites_str.replace(",", ""))
             except ValueError:
                 return None
         return None
 
-    def _extract_more(self, soup: BeautifulSoup) -> str:
-        more_div = soup.find("div", class_="people-informantion-more")
-        if more_div:
-            return more_div.get_text(separator="\n").strip()
+    @staticmethod
+    def _extract_more(tree: HtmlElement) -> str:
+        more_divs = MORE_XPATH(tree)
+        if more_divs:
+            return "\n".join(more_divs[0].itertext()).strip()
         return ""
 
-    def _extract_voice_acting_roles(self, soup: BeautifulSoup) -> List[Dict]:
+    @staticmethod
+    def _extract_voice_acting_roles(table: Optional[HtmlElement]) -> List[Dict]:
         roles = []
-        table = soup.find("table", class_="js-table-people-character")
-        if table:
-            for row in table.find_all("tr"):
-                columns = row.find_all("td")
-                if len(columns) >= 3:
-                    anime_anchor = columns[1].find("a", class_="js-people-title")
-                    anime_title = anime_anchor.text.strip() if anime_anchor else None
-                    anime_url = (
-                        anime_anchor["href"].strip()
-                        if anime_anchor and "href" in anime_anchor.attrs
+        if table is None:
+            return roles
+        for row in ROWS_XPATH(table):
+            columns = CELLS_XPATH(row)
+            if len(columns) >= 3:
+                anime_anchors = PEOPLE_TITLE_XPATH(columns[1])
+                anime_anchor = anime_anchors[0] if anime_anchors else None
+                anime_title = (
+                    anime_anchor.text_content().strip() if anime_anchor is not None else None
+                )
+                anime_url = (
+                    anime_anchor.get("href").strip()
+                    if anime_anchor is not None and anime_anchor.get("href") is not None
+                    else None
+                )
+                character_divs = SPACEIT_PAD_XPATH(columns[2])
+                if character_divs:
+                    char_anchors = ANCHOR_XPATH(character_divs[0])
+                    char_anchor = char_anchors[0] if char_anchors else None
+                    character_name = (
+                        char_anchor.text_content().strip()
+                        if char_anchor is not None
                         else None
                     )
-                    character_divs = columns[2].find_all("div", class_="spaceit_pad")
-                    if character_divs:
-                        char_anchor = character_divs[0].find("a")
-                        character_name = (
-                            char_anchor.text.strip() if char_anchor else None
-                        )
-                        character_url = (
-                            char_anchor["href"].strip()
-                            if char_anchor and "href" in char_anchor.attrs
-                            else None
-                        )
-                        role_type = (
-                            character_divs[1].text.strip()
-                            if len(character_divs) > 1
-                            else None
-                        )
-                    else:
-                        character_name = None
-                        character_url = None
-                        role_type = None
-
-                    role_info = {
-                        "anime_title": anime_title,
-                        "anime_url": anime_url,
-                        "character_name": character_name,
-                        "character_url": character_url,
-                        "role_type": role_type,
-                    }
-                    roles.append(role_info)
+                    character_url = (
+                        char_anchor.get("href").strip()
+                        if char_anchor is not None and char_anchor.get("href") is not None
+                        else None
+                    )
+                    role_type = (
+                        character_divs[1].text_content().strip()
+                        if len(character_divs) > 1
+                        else None
+                    )
+                else:
+                    character_name = None
+                    character_url = None
+                    role_type = None
+
+                role_info = {
+                    "anime_title": anime_title,
+                    "anime_url": anime_url,
+                    "character_name": character_name,
+                    "character_url": character_url,
+                    "role_type": role_type,
+                }
+                roles.append(role_info)
         return roles
 
-    def _extract_anime_staff_positions(self, soup: BeautifulSoup) -> List[Dict]:
+    @staticmethod
+    def _extract_anime_staff_positions(table: Optional[HtmlElement]) -> List[Dict]:
         positions = []
-        table = soup.find("table", class_="js-table-people-staff")
-        if table:
-            for row in table.find_all("tr"):
-                columns = row.find_all("td")
-                if len(columns) > 1:
-                    anime_link = columns[1].find("a", class_="js-people-title")
-                    if anime_link:
-                        position_info = {
-                            "anime_title": anime_link.text.strip(),
-                            "anime_url": anime_link["href"].strip(),
-                            "position": (
-                                columns[1].find("small").text.strip()
-                                if columns[1].find("small")
-                                else None
-                            ),
-                        }
-                        positions.append(position_info)
+        if table is None:
+            return positions
+        for row in ROWS_XPATH(table):
+            columns = CELLS_XPATH(row)
+            if len(columns) > 1:
+                anime_links = PEOPLE_TITLE_XPATH(columns[1])
+                if anime_links:
+                    anime_link = anime_links[0]
+                    small_tags = SMALL_XPATH(columns[1])
+                    position_info = {
+                        "anime_title": anime_link.text_content().strip(),
+                        "anime_url": anime_link.get("href").strip(),
+                        "position": (
+                            small_tags[0].text_content().strip() if small_tags else None
+                        ),
+                    }
+                    positions.append(position_info)
         return positions
 
-    def _extract_published_manga(self, soup: BeautifulSoup) -> List[Dict]:
+    @staticmethod
+    def _extract_published_manga(table: Optional[HtmlElement]) -> List[Dict]:
         works = []
-        table = soup.find("table", class_="js-table-people-manga")
-        if table:
-            for row in table.find_all("tr"):
-                columns = row.find_all("td")
-                if len(columns) > 1:
-                    manga_link = columns[1].find("a", class_="js-people-title")
-                    if manga_link:
-                        role_tag = columns[1].find("small")
-                        role = role_tag.text.strip() if role_tag else None
-                        work_info = {
-                            "manga_title": manga_link.text.strip(),
-                            "manga_url": manga_link["href"].strip(),
-                            "role": role,
-                        }
-                        works.append(work_info)
+        if table is None:
+            return works
+        for row in ROWS_XPATH(table):
+            columns = CELLS_XPATH(row)
+            if len(columns) > 1:
+                manga_links = PEOPLE_TITLE_XPATH(columns[1])
+                if manga_links:
+                    manga_link = manga_links[0]
+                    role_tags = SMALL_XPATH(columns[1])
+                    role = role_tags[0].text_content().strip() if role_tags else None
+                    work_info = {
+                        "manga_title": manga_link.text_content().strip(),
+                        "manga_url": manga_link.get("href").strip(),
+                        "role": role,
+                    }
+                    works.append(work_info)
         return works
 
 
@@ -202,9 +389,13 @@ class MALPeopleScraper:
         self,
         data_transformer: IDataTransformer,
         data_storage: IDataStorage,
+        limiter: Optional[HostRateLimiter] = None,
     ):
         self.data_transformer = data_transformer
         self.data_storage = data_storage
+        # Share one limiter between scrapers that hit the same host
+        self.limiter = limiter or HostRateLimiter()
+        self.http = requests.Session()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -221,92 +412,170 @@ class MALPeopleScraper:
 
     def scrape(self, url: str) -> Dict[str, Any]:
         try:
-            response = make_request("GET", url, headers=self.headers)
-            return {"html": response.text, "url": url}
+            response = make_request(
+                self.http, "GET", url, limiter=self.limiter, headers=self.headers
+            )
+            return {"html": response.content, "url": url}
         except requests.RequestException as e:
             logging.error(f"Failed to fetch {url}: {e}")
             return None
 
+    async def scrape_async(
+        self, url: str, session: aiohttp.ClientSession
+    ) -> Dict[str, Any]:
+        """Fetch over an already-open aiohttp session to reuse its connections"""
+        try:
+            html = await make_request_async(
+                session, "GET", url, limiter=self.limiter, headers=self.headers
+            )
+            return {"html": html, "url": url}
+        except aiohttp.ClientError as e:
+            logging.error(f"Failed to fetch {url}: {e}")
+            return None
+
+    def _finish(self, checkpoint) -> None:
+        """Close storage, then save and close the checkpoint."""
+        try:
+            self.data_storage.close()
+        finally:
+            checkpoint.save_checkpoint()
+            checkpoint.close()
+
     async def scrape_all_people(
         self,
         output_prefix: str = "data",
         checkpoint_path: str = "people_checkpoint.json",
-        save_checkpoint_interval: int = 1,  # Save checkpoint after every N successful scrapes
+        save_checkpoint_interval: int = 1,  # Save the checkpoint after every N completed IDs
+        fetch_workers: int = 4,
+        upload_workers: int = 8,
     ) -> None:
         """
         Asynchronously paginate through the people entry pages and scrape each individual voice actor page.
         Supports checkpointing to resume from where it left off.
 
+        Pagination feeds a bounded queue drained by `fetch_workers` scrape
+        workers; `upload_workers` uploaders store records. Stored IDs are
+        marked completed once per page, after the storage is flushed, so
+        batching storages never checkpoint records they have not uploaded.
+
         Args:
             output_prefix (str): The prefix for the GCS storage path
             checkpoint_path (str): Path to the checkpoint file
-            save_checkpoint_interval (int): How often to save the checkpoint (after every N successful scrapes)
+            save_checkpoint_interval (int): Checkpoint saves are coalesced to at most one
+                per this many completed IDs or 30 seconds
+            fetch_workers (int): Number of voice actors scraped concurrently
+            upload_workers (int): Number of records uploaded concurrently
         """
-        from .utils import paginate_people
-
         # Initialize checkpoint handler
         checkpoint = PeopleCheckpointHandler(checkpoint_path)
-        successful_scrapes = 0
 
-        async with aiohttp.ClientSession() as client:
-            async for person_url in paginate_people(client, checkpoint):
-                try:
-                    people_id = int(person_url.rstrip("/").split("/")[-1])
-                except ValueError:
-                    logging.error(f"Could not extract people_id from URL: {person_url}")
-                    continue
+        people_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        record_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        # Stored but not yet flushed, so not yet safe to checkpoint
+        pending_ids: List[int] = []
 
+        # Parsing is CPU-bound, so it runs in worker processes to use every
+        # core and keep the GIL free for the event loop
+        parse_pool = ProcessPoolExecutor()
+        loop = asyncio.get_running_loop()
+
+        async def fetch_worker(client: aiohttp.ClientSession) -> None:
+            while True:
+                people_id, person_url = await people_queue.get()
                 try:
                     # Skip if already completed (additional check in case pagination logic missed it)
                     if checkpoint.is_completed(people_id):
-                        logging.debug(
-                            f"Skipping already processed people ID: {people_id}"
-                        )
+                        logging.debug("Skipping already processed people ID: %d", people_id)
                         continue
 
-                    # Scrape the people page
-                    raw_data = self.scrape(person_url)
+                    # Fetch over the shared session, then parse in the process pool
+                    raw_data = await self.scrape_async(person_url, client)
                     if raw_data is None:
                         logging.warning(
                             f"Failed to scrape people ID: {people_id}, will retry later"
                         )
                         # Don't mark as completed, it will be retried on next run
-                        await asyncio.sleep(2)  # Small delay before continuing
                         continue
 
-                    # Transform the data
-                    voice_actor_data = self.data_transformer.transform(
-                        raw_data, people_id
+                    # The transformer is stateless, so pickling it per call is cheap
+                    voice_actor_data = await loop.run_in_executor(
+                        parse_pool, self.data_transformer.transform, raw_data, people_id
                     )
-
                     if voice_actor_data:
-                        # Define a unique output path for each voice actor using their people_id.
-                        file_path = f"{output_prefix}/{people_id}.json"
-                        self.data_storage.store(voice_actor_data, file_path)
-
-                        # Mark as completed and update checkpoint
-                        checkpoint.mark_completed(people_id)
-                        successful_scrapes += 1
-
-                        # Periodically save the checkpoint
-                        if successful_scrapes % save_checkpoint_interval == 0:
-                            checkpoint.save_checkpoint()
-
-                        logging.info(
-                            f"Scraped and stored voice actor {people_id} to GCS (Total: {checkpoint.get_completed_count()})"
-                        )
-
-                    # Add a small delay to avoid rate limiting
-                    await asyncio.sleep(1)
+                        await record_queue.put((people_id, voice_actor_data))
 
                 except Exception as e:
+                    # Network errors are already retried with exponential backoff
                     logging.error(f"Error scraping voice actor {people_id}: {e}")
-                    # Pause a bit longer on error
-                    await asyncio.sleep(5)
-                    continue
+                finally:
+                    people_queue.task_done()
 
-            # Final checkpoint save after complete
-            checkpoint.save_checkpoint()
+        async def uploader() -> None:
+            while True:
+                people_id, voice_actor_data = await record_queue.get()
+                try:
+                    # Define a unique output path for each voice actor using their people_id.
+                    file_path = f"{output_prefix}/{people_id}.json"
+                    # GCS uploads block, so each runs in a thread; several
+                    # uploaders keep upload latency from throttling scraping
+                    await asyncio.to_thread(
+                        self.data_storage.store, voice_actor_data, file_path
+                    )
+
+                    pending_ids.append(people_id)
+                    logging.info("Scraped and stored voice actor %d to GCS", people_id)
+                except Exception as e:
+                    logging.error(f"Error storing voice actor {people_id}: {e}")
+                finally:
+                    record_queue.task_done()
+
+        async def drain() -> None:
+            # Finish the current page before pagination checkpoints the next one
+            await people_queue.join()
+            await record_queue.join()
+            if not pending_ids:
+                return
+            try:
+                await asyncio.to_thread(self.data_storage.flush)
+            except Exception as e:
+                # IDs stay pending and are checkpointed after the next successful flush
+                logging.error(f"Error flushing voice actor records: {e}")
+                return
+            for people_id in pending_ids:
+                checkpoint.mark_completed(people_id)
+            pending_ids.clear()
             logging.info(
-                f"Voice actor scraping completed. Total processed: {checkpoint.get_completed_count()}"
+                f"Checkpointed stored voice actors (Total: {checkpoint.get_completed_count()})"
+            )
+
+        async with make_session(fetch_workers + 1) as client:
+            workers = [
+                asyncio.create_task(fetch_worker(client)) for _ in range(fetch_workers)
+            ]
+            workers.extend(
+                asyncio.create_task(uploader()) for _ in range(upload_workers)
+            )
+            # Saves the checkpoint off the event loop, coalescing changes
+            workers.append(
+                asyncio.create_task(checkpoint.run_flusher(save_checkpoint_interval))
             )
+            try:
+                # Listing pages share the entry pages' rate limit
+                async for batch in paginate_people(
+                    client, checkpoint, before_next_page=drain, limiter=self.limiter
+                ):
+                    for person in batch:
+                        await people_queue.put(person)
+                await drain()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+                # Final save runs even if the scrape failed or was cancelled,
+                # and off the event loop like the periodic ones
+                await asyncio.to_thread(self._finish, checkpoint)
+
+        logging.info(
+            f"Voice actor scraping completed. Total processed: {checkpoint.get_completed_count()}"
+        )
@@ -1,34 +1,161 @@
 import time
+import asyncio
 import logging
+import threading
+import aiohttp
 import requests
-from tenacity import retry, wait_exponential, stop_never
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+from tenacity import retry, retry_if_exception, wait_exponential, stop_never
 
 
-# Custom session that delays requests if called too soon
-class InterceptedSession(requests.Session):
-    def __init__(self, sleep_in_ms):
-        super().__init__()
-        self.sleep_in_ms = sleep_in_ms  # Minimum delay between requests in milliseconds
-        self.last_requested_at = 0
+# Statuses worth retrying; any other HTTP error (e.g. a 404) fails at once
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Idle connections and DNS answers are kept long enough to span the rate limiter's waits
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+# A stalled request is abandoned and retried instead of holding a worker for
+# aiohttp's default five minutes
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
+# X-RateLimit-Reset values above this are epoch timestamps rather than
+# delays; no rate-limit window lasts anywhere near 1e9 seconds
+RESET_EPOCH_MIN = 1e9
 
-    def request(self, method, url, **kwargs):
-        now = time.time() * 1000  # current time in milliseconds
-        delta = now - self.last_requested_at
-        if delta < self.sleep_in_ms:
-            delay = (self.sleep_in_ms - delta) / 1000  # convert to seconds
-            time.sleep(delay)
-        self.last_requested_at = time.time() * 1000
-        logging.info("Loading %s", url)
-        return super().request(method, url, **kwargs)
 
+def make_connector(limit_per_host: int) -> aiohttp.TCPConnector:
+    """Connection pool for a scraping session; must be created on the running loop."""
+    return aiohttp.TCPConnector(
+        limit_per_host=limit_per_host,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+
+
+def make_session(limit_per_host: int) -> aiohttp.ClientSession:
+    """
+    Session for one scrape; listing and entry requests all go through it so
+    they share warm keep-alive connections. Must be created on the running loop.
+    """
+    return aiohttp.ClientSession(
+        connector=make_connector(limit_per_host), timeout=REQUEST_TIMEOUT
+    )
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # Network errors carry no status and are always retried
+    if isinstance(exc, requests.HTTPError):
+        status = exc.response.status_code if exc.response is not None else None
+    else:
+        status = getattr(exc, "status", None)
+    return status is None or status in RETRY_STATUSES
+
+
+# Per-host token bucket: on average one request per `interval` seconds to
+# each host, with up to `burst` requests allowed back to back. Responses can
+# push a host's next slot further out via Retry-After / X-RateLimit-* headers.
+class HostRateLimiter:
+    def __init__(self, interval: float = 1.0, burst: int = 4):
+        self.interval = interval  # Average delay between requests to one host, in seconds
+        self.burst = burst  # Requests that may go out without waiting
+        self._next_free_at: Dict[str, float] = {}  # When each host's bucket is next fully drained
+        self._lock = threading.Lock()  # Shared by coroutines and CLI worker threads
+
+    def reserve_delay(self, host: str) -> float:
+        """Reserve the next request slot for host and return the seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            next_free_at = max(self._next_free_at.get(host, now), now)
+            scheduled_at = max(now, next_free_at - (self.burst - 1) * self.interval)
+            self._next_free_at[host] = next_free_at + self.interval
+        return scheduled_at - now
 
-# Create an instance with a delay (e.g., 1000ms)
-session = InterceptedSession(sleep_in_ms=1000)
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold back every request to host for at least `seconds`"""
+        with self._lock:
+            # Drained bucket at now + seconds, so the next request waits the full delay
+            resume_at = time.monotonic() + seconds + (self.burst - 1) * self.interval
+            self._next_free_at[host] = max(self._next_free_at.get(host, 0.0), resume_at)
+
+    def update(self, host: str, headers: Mapping[str, str]) -> None:
+        """Adjust host's next slot from a response's rate-limit headers"""
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                self.defer(host, float(retry_after))
+            except ValueError:
+                self.defer(host, self.interval)
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+        # Reset is either an epoch timestamp or seconds until the window resets;
+        # a stale timestamp means the window has already reset
+        if reset > RESET_EPOCH_MIN:
+            reset = reset - time.time()
+        if remaining <= 0:
+            self.defer(host, max(0.0, reset))
+
+    async def wait(self, host: str) -> None:
+        delay = self.reserve_delay(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait_blocking(self, host: str) -> None:
+        delay = self.reserve_delay(host)
+        if delay > 0:
+            time.sleep(delay)
 
 
 # Define a function that uses tenacity to retry infinitely with exponential backoff
-@retry(wait=wait_exponential(multiplier=1, min=1, max=60), stop=stop_never)
-def make_request(method, url, **kwargs):
-    response = session.request(method, url, **kwargs)
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_exponential(multiplier=1, min=1, max=60),
+    stop=stop_never,
+)
+def make_request(
+    http: requests.Session,
+    method,
+    url,
+    limiter: Optional[HostRateLimiter] = None,
+    **kwargs,
+):
+    host = urlsplit(url).netloc
+    if limiter:
+        limiter.wait_blocking(host)
+    logging.info("Loading %s", url)
+    response = http.request(method, url, **kwargs)
+    if limiter:
+        limiter.update(host, response.headers)
     response.raise_for_status()  # raise an error for bad responses
     return response
+
+
+# Async counterpart; sleeps on the event loop rather than blocking it and
+# returns the raw body bytes, leaving decoding to the parser
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_exponential(multiplier=1, min=1, max=60),
+    stop=stop_never,
+)
+async def make_request_async(
+    client: aiohttp.ClientSession,
+    method,
+    url,
+    limiter: Optional[HostRateLimiter] = None,
+    **kwargs,
+) -> bytes:
+    host = urlsplit(url).netloc
+    if limiter:
+        await limiter.wait(host)
+    logging.info("Loading %s", url)
+    async with client.request(method, url, **kwargs) as response:
+        if limiter:
+            limiter.update(host, response.headers)
+        response.raise_for_status()  # raise an error for bad responses
+        return await response.read()
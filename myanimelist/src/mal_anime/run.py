@@ -10,8 +10,18 @@ from .scraper import (
     MALScraper,
     MALDataTransformer,
     GCSDataStorage,
+    NDJSONShardStorage,
 )
-from .people_scraper import VADataTransformer, MALPeopleScraper, GCSDataStorage
+from .people_scraper import (
+    VADataTransformer,
+    MALPeopleScraper,
+    GCSDataStorage,
+    GCSBatchedJSONLStorage,
+)
+from .retry import HostRateLimiter
+from .html_cache import HTMLCache
+from .anime_checkpoint import AnimeCheckpointHandler
+from .people_checkpoint import PeopleCheckpointHandler
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +47,9 @@ class ScraperManager:
         anime_checkpoint: str = "anime_checkpoint.json",
         people_checkpoint: str = "people_checkpoint.json",
         save_interval: int = 1,
+        local_output: bool = False,
+        batch_uploads: bool = False,
+        html_cache_dir: Optional[str] = None,
     ):
         self.anime_bucket = anime_bucket
         self.people_bucket = people_bucket
@@ -46,24 +59,42 @@ class ScraperManager:
         self.anime_checkpoint = anime_checkpoint
         self.people_checkpoint = people_checkpoint
         self.save_interval = save_interval
+        self.local_output = local_output
+        self.batch_uploads = batch_uploads
+        self.html_cache_dir = html_cache_dir
         self.anime_scraper = None
         self.people_scraper = None
+        # Both scrapers hit myanimelist.net, so they share one rate limit
+        self.limiter = HostRateLimiter()
 
     def setup_anime_scraper(self):
-        """Initialize and return the anime scraper with GCS storage."""
+        """Initialize and return the anime scraper with GCS (or local NDJSON) storage."""
+        if self.local_output:
+            data_storage = NDJSONShardStorage(self.anime_output_prefix)
+        elif self.batch_uploads:
+            data_storage = GCSBatchedJSONLStorage(self.anime_bucket, self.project_id)
+        else:
+            data_storage = GCSDataStorage(self.anime_bucket, self.project_id)
+        cache = HTMLCache(self.html_cache_dir) if self.html_cache_dir else None
+        data_scraper = MALScraper(self.limiter, cache)
         self.anime_scraper = MALAnimeScraper(
             url_generator=MALUrlGenerator(),
-            data_scraper=MALScraper(),
-            data_transformer=MALDataTransformer(),
-            data_storage=GCSDataStorage(self.anime_bucket, self.project_id),
+            data_scraper=data_scraper,
+            data_transformer=MALDataTransformer(data_scraper),
+            data_storage=data_storage,
         )
         return self.anime_scraper
 
     def setup_people_scraper(self):
         """Initialize and return the people/voice actor scraper with GCS storage."""
+        if self.batch_uploads:
+            data_storage = GCSBatchedJSONLStorage(self.people_bucket, self.project_id)
+        else:
+            data_storage = GCSDataStorage(self.people_bucket, self.project_id)
         self.people_scraper = MALPeopleScraper(
             data_transformer=VADataTransformer(),
-            data_storage=GCSDataStorage(self.people_bucket, self.project_id),
+            data_storage=data_storage,
+            limiter=self.limiter,
         )
         return self.people_scraper
 
@@ -82,14 +113,16 @@ class ScraperManager:
         Path(self.anime_output_prefix).parent.mkdir(parents=True, exist_ok=True)
         Path(self.people_output_prefix).parent.mkdir(parents=True, exist_ok=True)
 
-        # Delete checkpoint files if not resuming
+        # Delete checkpoint files if not resuming, off the event loop
         if not resume:
-            if run_anime and Path(self.anime_checkpoint).exists():
-                Path(self.anime_checkpoint).unlink()
+            if run_anime and await asyncio.to_thread(
+                AnimeCheckpointHandler.delete_files, self.anime_checkpoint
+            ):
                 logging.info(f"Deleted anime checkpoint file to start fresh")
 
-            if run_people and Path(self.people_checkpoint).exists():
-                Path(self.people_checkpoint).unlink()
+            if run_people and await asyncio.to_thread(
+                PeopleCheckpointHandler.delete_files, self.people_checkpoint
+            ):
                 logging.info(f"Deleted people checkpoint file to start fresh")
 
         # Setup and start anime scraper if requested
@@ -138,10 +171,9 @@ class ScraperManager:
 
         # Get anime scraper status if checkpoint exists
         if Path(self.anime_checkpoint).exists():
-            from .anime_checkpoint import AnimeCheckpointHandler
-
             checkpoint = AnimeCheckpointHandler(self.anime_checkpoint)
             letter, page = checkpoint.get_pagination_state()
+            checkpoint.close()
             status["anime"] = {
                 "completed_count": checkpoint.get_completed_count(),
                 "current_letter": letter,
@@ -150,10 +182,9 @@ class ScraperManager:
 
         # Get people scraper status if checkpoint exists
         if Path(self.people_checkpoint).exists():
-            from .people_checkpoint import PeopleCheckpointHandler
-
             checkpoint = PeopleCheckpointHandler(self.people_checkpoint)
             letter, page = checkpoint.get_pagination_state()
+            checkpoint.close()
             status["people"] = {
                 "completed_count": checkpoint.get_completed_count(),
                 "current_letter": letter,
@@ -174,6 +205,9 @@ async def main_async(args):
         anime_checkpoint=args.anime_checkpoint,
         people_checkpoint=args.people_checkpoint,
         save_interval=args.interval,
+        local_output=args.local,
+        batch_uploads=args.batch_uploads,
+        html_cache_dir=args.html_cache,
     )
 
     if args.status:
@@ -216,6 +250,21 @@ def main():
         action="store_true",
         help="Don't resume from checkpoint, start fresh",
     )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Write anime records to local NDJSON shards instead of GCS",
+    )
+    parser.add_argument(
+        "--batch-uploads",
+        action="store_true",
+        help="Upload records to GCS as gzipped JSONL shards instead of one object each",
+    )
+    parser.add_argument(
+        "--html-cache",
+        metavar="DIR",
+        help="Cache fetched anime pages in DIR and reuse them on later runs",
+    )
 
     args = parser.parse_args()
 
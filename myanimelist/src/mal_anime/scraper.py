@@ -1,26 +1,140 @@
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 from datetime import datetime
-import json
-import uuid
-from typing import Dict, List, Any, Optional
+import io
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, NamedTuple, Optional, Union
 from .interfaces import IUrlGenerator, IDataScraper, IDataTransformer, IDataStorage
 from pathlib import Path
 import logging
 import time
 import re
 from .anime_checkpoint import AnimeCheckpointHandler
-from .utils import paginate_anime
+from .html_cache import HTMLCache
+from .utils import HTML_PARSER, has_class, next_airbyte_id, paginate_anime
 import aiohttp
 import asyncio
 import os
 from google.cloud import storage
-from .retry import make_request
+from google.cloud.storage import transfer_manager
+from .retry import HostRateLimiter, make_request, make_request_async, make_session
+
+# Compiled once; lxml evaluates each selection in C instead of walking the
+# tree from Python. Single-element lookups ask for the first match only.
+TITLE_STRONG_XPATH = etree.XPath(f"(//h1[{has_class('title-name')}]//strong)[1]")
+TITLE_XPATHS = (
+    TITLE_STRONG_XPATH,
+    etree.XPath(f"(//h1[{has_class('title-name')}])[1]"),
+    etree.XPath("(//span[@itemprop='name'])[1]"),
+)
+DESCRIPTION_XPATH = etree.XPath("(//p[@itemprop='description'])[1]")
+IMAGE_XPATH = etree.XPath("(//img[@itemprop='image'])[1]")
+RATING_VALUE_XPATH = etree.XPath("(//span[@itemprop='ratingValue'])[1]")
+RATING_COUNT_XPATH = etree.XPath("(//span[@itemprop='ratingCount'])[1]")
+GENRE_XPATH = etree.XPath("//span[@itemprop='genre']")
+# Left-side sections are an <h2> followed by sibling divs
+SECTION_HEADERS_XPATH = etree.XPath("//h2")
+DARK_TEXT_XPATH = etree.XPath(f"(.//span[{has_class('dark_text')}])[1]")
+ALT_TITLES_XPATH = etree.XPath(f"(//div[{has_class('js-alternative-titles')}])[1]")
+SPACEIT_PAD_XPATH = etree.XPath(f".//div[{has_class('spaceit_pad')}]")
+DIRECT_LINKS_XPATH = etree.XPath(f"a[{has_class('link')}]")
+LINKS_XPATH = etree.XPath(f".//a[{has_class('link')}]")
+JS_LINKS_XPATH = etree.XPath(
+    f"(.//div[{has_class('js-links')} and @data-rel='resource'])[1]"
+)
+CAPTION_XPATH = etree.XPath(f"(.//div[{has_class('caption')}])[1]")
+ANCHORS_XPATH = etree.XPath(".//a")
+FIRST_ANCHOR_XPATH = etree.XPath("(.//a)[1]")
+# Theme song blocks are matched on their whole class attribute, as bs4 did
+THEME_SONGS_XPATH = etree.XPath("(//div[normalize-space(@class) = $classes])[1]")
+ROWS_XPATH = etree.XPath(".//tr")
+THEME_SONG_TITLE_XPATH = etree.XPath(f"(.//span[{has_class('theme-song-title')}])[1]")
+THEME_SONG_ARTIST_XPATH = etree.XPath(f"(.//span[{has_class('theme-song-artist')}])[1]")
+THEME_SONG_EPISODE_XPATH = etree.XPath(f"(.//span[{has_class('theme-song-episode')}])[1]")
+ENTRIES_TILE_XPATH = etree.XPath(f"(//div[{has_class('entries-tile')}])[1]")
+ENTRY_XPATH = etree.XPath(f".//div[{has_class('entry')}]")
+RELATION_XPATH = etree.XPath(f"(.//div[{has_class('relation')}])[1]")
+ENTRY_TITLE_XPATH = etree.XPath(f"(.//div[{has_class('title')}])[1]")
+BROADCASTS_XPATH = etree.XPath(f"(//div[{has_class('broadcasts')}])[1]")
+BROADCAST_ITEM_XPATH = etree.XPath(f".//a[{has_class('broadcast-item')}]")
+# First link whose href ends in "/characters"
+CHARACTERS_LINK_XPATH = etree.XPath(
+    "(//a[substring(@href, string-length(@href) - 10) = '/characters'])[1]"
+)
+# Characters & Staff page: one table per character, one row per voice actor
+CHARACTER_TABLES_XPATH = etree.XPath(f"//table[{has_class('js-anime-character-table')}]")
+CHARACTER_LINK_XPATH = etree.XPath("(.//a[contains(@href, '/character/')])[1]")
+VA_ROWS_XPATH = etree.XPath(f".//tr[{has_class('js-anime-character-va-lang')}]")
+VA_NAME_CELL_XPATH = etree.XPath("(.//td[@align='right'])[1]")
+VA_LINK_XPATH = etree.XPath("(.//a[contains(@href, '/people/')])[1]")
+VA_LANGUAGE_XPATH = etree.XPath(f"(.//div[{has_class('js-anime-character-language')}])[1]")
+
+# The first two breadcrumbs are the same on every anime page; records only
+# ever serialize them, so one pair of dicts is shared
+STATIC_BREADCRUMBS = (
+    {
+        "_type": "http://schema.org/ListItem",
+        "item": "https://myanimelist.net/",
+        "position": "1",
+    },
+    {
+        "_type": "http://schema.org/ListItem",
+        "item": "https://myanimelist.net/anime.php",
+        "position": "2",
+    },
+)
+
+# Fields of the left column's Alternative Titles and Information blocks,
+# in output order; each starts out empty
+MAIN_TITLE_KEYS = ("Synonyms", "Japanese")
+ALTERNATIVE_TITLE_KEYS = MAIN_TITLE_KEYS + ("English", "German", "Spanish", "French")
+INFORMATION_KEYS = (
+    "Type",
+    "Episodes",
+    "Status",
+    "Aired",
+    "Premiered",
+    "Broadcast",
+    "Producers",
+    "Licensors",
+    "Studios",
+    "Source",
+    "Genres",
+    "Theme",
+    "Demographic",
+    "Duration",
+    "Rating",
+)
+
+# Compiled once rather than on every call
+RANKED_PATTERN = re.compile(r"#\d+")
+CHARACTER_ID_PATTERN = re.compile(r"/character/(\d+)")
+PEOPLE_ID_PATTERN = re.compile(r"/people/(\d+)")
+
+# Characters & Staff link in a raw anime page, so the async pipeline can
+# fetch that page before parsing; the transformer still finds the link itself
+CHARACTERS_LINK_PATTERN = re.compile(rb'<a\s[^>]*?href="([^"]*/characters)"')
+
+
+class CharactersPageRequest(NamedTuple):
+    """
+    Returned by a transform in a parse worker instead of a record when the
+    Characters & Staff page it needs was not prefetched; the caller fetches
+    `url` and transforms again with it.
+    """
+
+    url: str
 
 
 class GCSDataStorage(IDataStorage):
     """Storage implementation for Google Cloud Storage"""
 
+    # Concurrent uploads used by store_all
+    upload_workers = 16
+
     def __init__(self, bucket_name: str, project_id: str = None, base_path: str = ""):
         """
         Initialize GCS storage
@@ -37,8 +151,7 @@ class GCSDataStorage(IDataStorage):
             f"Initialized GCS storage with bucket '{bucket_name}' and base path '{base_path}'"
         )
 
-    def store(self, data: Dict[str, Any], output_path: str) -> None:
-        """Store a single record to GCS"""
+    def _blob_path(self, data: Dict[str, Any], output_path: str) -> str:
         # Extract anime ID from the data
         anime_id = data.get("_airbyte_data", {}).get("id")
         if not anime_id:
@@ -48,26 +161,39 @@ class GCSDataStorage(IDataStorage):
             filename = f"{anime_id}.json"
 
         # Construct full GCS path
-        blob_path = f"{self.base_path}/{filename}" if self.base_path else filename
+        return f"{self.base_path}/{filename}" if self.base_path else filename
+
+    def store(self, data: Dict[str, Any], output_path: str) -> None:
+        """Store a single record to GCS"""
+        blob_path = self._blob_path(data, output_path)
 
-        # Convert data to JSON
-        json_data = json.dumps(data, ensure_ascii=False, indent=2)
+        # Compact JSON: indenting only inflates the upload and nothing reads it by eye
+        json_data = orjson.dumps(data)
 
         # Upload to GCS
         blob = self.bucket.blob(blob_path)
         blob.upload_from_string(data=json_data, content_type="application/json")
-        logging.info(f"Data stored to gs://{self.bucket.name}/{blob_path}")
+        logging.info("Data stored to gs://%s/%s", self.bucket.name, blob_path)
 
     def store_all(self, records: List[Dict], output_path: str) -> None:
         """Store multiple records to GCS"""
+        uploads = []
         for record in records:
             anime_id = record.get("_airbyte_data", {}).get("id")
             if not anime_id:
                 logging.warning(f"Record missing anime ID, using index as filename")
                 continue
-
-            # Use store method to save individual record
-            self.store(record, f"{anime_id}.json")
+            blob = self.bucket.blob(self._blob_path(record, f"{anime_id}.json"))
+            uploads.append((io.BytesIO(orjson.dumps(record)), blob))
+
+        # Upload the records concurrently rather than one request after another
+        transfer_manager.upload_many(
+            uploads,
+            upload_kwargs={"content_type": "application/json"},
+            worker_type=transfer_manager.THREAD,
+            max_workers=self.upload_workers,
+            raise_exception=True,
+        )
 
         logging.info(
             f"All {len(records)} records stored to GCS bucket {self.bucket.name} in {self.base_path}"
@@ -81,122 +207,216 @@ class MALUrlGenerator(IUrlGenerator):
 
 
 class MALScraper(IDataScraper):
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+    }
 
-    @staticmethod
-    def scrape(url: str) -> Dict[str, Any]:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-        }
+    def __init__(
+        self,
+        limiter: Optional[HostRateLimiter] = None,
+        cache: Optional[HTMLCache] = None,
+    ):
+        # Share one limiter between scrapers that hit the same host
+        self.limiter = limiter or HostRateLimiter()
+        self.http = requests.Session()
+        # Pages found here are served from disk without touching the limiter
+        self.cache = cache
+
+    def scrape(self, url: str) -> Dict[str, Any]:
+        if self.cache:
+            html = self.cache.get(url)
+            if html is not None:
+                return {"html": html, "url": url}
         try:
-            response = make_request("GET", url, headers=headers)
+            response = make_request(
+                self.http, "GET", url, limiter=self.limiter, headers=self.HEADERS
+            )
             response.raise_for_status()
-            return {"html": response.text, "url": url}
         except requests.RequestException as e:
             logging.error(f"Failed to fetch {url}: {e}")
             return None
+        if self.cache:
+            self.cache.put(url, response.content)
+        return {"html": response.content, "url": url}
+
+    async def scrape_async(
+        self, url: str, session: aiohttp.ClientSession
+    ) -> Dict[str, Any]:
+        """Fetch over an already-open aiohttp session to reuse its connections"""
+        if self.cache:
+            html = await asyncio.to_thread(self.cache.get, url)
+            if html is not None:
+                return {"html": html, "url": url}
+        try:
+            html = await make_request_async(
+                session, "GET", url, limiter=self.limiter, headers=self.HEADERS
+            )
+        except aiohttp.ClientError as e:
+            logging.error(f"Failed to fetch {url}: {e}")
+            return None
+        if self.cache:
+            await asyncio.to_thread(self.cache.put, url, html)
+        return {"html": html, "url": url}
+
+
+def _first(xpath: etree.XPath, node: HtmlElement, **variables) -> Optional[HtmlElement]:
+    matches = xpath(node, **variables)
+    return matches[0] if matches else None
+
+
+def _section_divs(section: List[HtmlElement], class_name: Optional[str] = None):
+    # Divs of a left-side section, optionally only those with a class token
+    for element in section:
+        if element.tag == "div" and (
+            class_name is None or class_name in element.get("class", "").split()
+        ):
+            yield element
+
+
+def _joined_stripped_text(node: HtmlElement) -> str:
+    # Same as bs4's get_text(strip=True): every text node stripped, then concatenated
+    return "".join(text.strip() for text in node.itertext())
 
 
 class MALDataTransformer(IDataTransformer):
-    def __init__(self):
-        self.mal_id = None
+    __slots__ = ("mal_id", "data_scraper")
 
-    def transform(self, raw_data: Dict[str, Any], mal_id: int) -> Dict[str, Any]:
+    def __init__(self, data_scraper: Optional[MALScraper] = None):
+        self.mal_id = None
+        # Fetches the Characters & Staff page; pass the pipeline's scraper to share its rate limit
+        self.data_scraper = data_scraper or MALScraper()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sent to parse worker processes without the scraper: its session and
+        # rate limiter don't pickle, and a worker's own limiter would bypass
+        # the shared per-host budget. Workers never fetch.
+        return {"mal_id": self.mal_id}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.mal_id = state["mal_id"]
+        self.data_scraper = None
+
+    def transform(
+        self, raw_data: Dict[str, Any], mal_id: int
+    ) -> Union[Dict[str, Any], CharactersPageRequest]:
         self.mal_id = mal_id
-        soup = BeautifulSoup(raw_data["html"], "html.parser")
+        tree = lxml.html.fromstring(raw_data["html"], parser=HTML_PARSER)
+        voice_actors = self._extract_characters_voice_actors_list(
+            tree, raw_data.get("characters_page")
+        )
+        if isinstance(voice_actors, CharactersPageRequest):
+            return voice_actors
 
         transformed_data = {
-            "_airbyte_ab_id": str(uuid.uuid4()),
-            "_airbyte_emitted_at": int(time.time() * 1000),
+            "_airbyte_ab_id": next_airbyte_id(),
+            "_airbyte_emitted_at": time.time_ns() // 1_000_000,
             "_airbyte_data": {
                 "id": self.mal_id,
-                "title": self._extract_title(soup),
+                "title": self._extract_title(tree),
                 "url": f"https://myanimelist.net/anime/{self.mal_id}",
-                "microdata": self._extract_microdata(soup),
-                "leftSide": self._extract_left_side(soup),
-                "relatedEntries": self._extract_related_entries(soup),
-                "themeSongs": self._extract_theme_songs(soup),
-                "streamingPlatforms": self._extract_streaming_platforms(soup),
-                "voiceActors": self._extract_characters_voice_actors_list(soup),
+                "microdata": self._extract_microdata(tree),
+                "leftSide": self._extract_left_side(tree),
+                "relatedEntries": self._extract_related_entries(tree),
+                "themeSongs": self._extract_theme_songs(tree),
+                "streamingPlatforms": self._extract_streaming_platforms(tree),
+                "voiceActors": voice_actors,
             },
         }
 
         return transformed_data
 
-    def _extract_microdata(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_microdata(self, tree: HtmlElement) -> List[Dict]:
+        # Both entries carry the same breadcrumb list
+        breadcrumbs = self._extract_breadcrumbs()
         return [
             {
                 "_type": "http://schema.org/TVSeries",
-                "name": self._get_text(soup, "h1.title-name strong"),
-                "image": self._get_image_url(soup),
-                "genre": self._extract_genres(soup),
-                "aggregateRating": self._extract_rating(soup),
-                "itemListElement": self._extract_breadcrumbs(soup),
-                "description": self._get_text(soup, 'p[itemprop="description"]'),
+                "name": self._get_text(tree, TITLE_STRONG_XPATH),
+                "image": self._get_image_url(tree),
+                "genre": self._extract_genres(tree),
+                "aggregateRating": self._extract_rating(tree),
+                "itemListElement": breadcrumbs,
+                "description": self._get_text(tree, DESCRIPTION_XPATH),
             },
             {
                 "_type": "http://schema.org/BreadcrumbList",
-                "itemListElement": self._extract_breadcrumbs(soup),
+                "itemListElement": breadcrumbs,
             },
         ]
 
-    def _get_text(self, soup: BeautifulSoup, selector: str) -> str:
-        element = soup.select_one(selector)
-        return element.text.strip() if element else ""
+    def _get_text(self, tree: HtmlElement, xpath: etree.XPath) -> str:
+        element = _first(xpath, tree)
+        return element.text_content().strip() if element is not None else ""
 
-    def _get_image_url(self, soup: BeautifulSoup) -> str:
-        img = soup.select_one('img[itemprop="image"]')
-        return img.get("src", "") if img else ""
+    def _get_image_url(self, tree: HtmlElement) -> str:
+        img = _first(IMAGE_XPATH, tree)
+        return img.get("src", "") if img is not None else ""
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: HtmlElement) -> str:
         # Try multiple title selectors
-        selectors = ["h1.title-name strong", "h1.title-name", "span[itemprop='name']"]
-        for selector in selectors:
-            title_tag = soup.select_one(selector)
-            if title_tag:
-                return title_tag.text.strip()
+        for xpath in TITLE_XPATHS:
+            title_tag = _first(xpath, tree)
+            if title_tag is not None:
+                return title_tag.text_content().strip()
         return "Unknown"
 
-    def _extract_left_side(self, soup: BeautifulSoup) -> Dict:
+    def _extract_left_side(self, tree: HtmlElement) -> Dict:
+        sections = self._index_sections(tree)
         left_side = {
-            "Alternative Titles": self._extract_alternative_titles(soup),
-            "Information": self._extract_information(soup),
-            "Statistics": self._extract_statistics(soup),
-            "Available At": self._extract_available_at(soup),
-            "Resources": self._extract_resources(soup),
+            "Alternative Titles": self._extract_alternative_titles(tree, sections),
+            "Information": self._extract_information(tree, sections),
+            "Statistics": self._extract_statistics(sections),
+            "Available At": self._extract_available_at(sections),
+            "Resources": self._extract_resources(sections),
         }
         return left_side
 
+    @staticmethod
+    def _index_sections(tree: HtmlElement) -> Dict[str, List[HtmlElement]]:
+        # One walk over the left column: each <h2> title maps to the sibling
+        # elements up to the next <h2>. The first header with a title wins.
+        sections = {}
+        for header in SECTION_HEADERS_XPATH(tree):
+            title = header.text_content()
+            if title in sections:
+                continue
+            section = sections[title] = []
+            for sibling in header.itersiblings():
+                if sibling.tag == "h2":
+                    break
+                section.append(sibling)
+        return sections
+
     def _clean_ranked_value(self, value: str) -> Optional[str]:
         if "N/A" in value:
             return "N/A"
 
         # Extract #NUMBER pattern
-        import re
-
-        match = re.search(r"#\d+", value)
+        match = RANKED_PATTERN.search(value)
         if match:
             return match.group(0)
         return None
 
-    def _extract_statistics(self, soup: BeautifulSoup) -> Dict:
+    def _extract_statistics(self, sections: Dict[str, List[HtmlElement]]) -> Dict:
         statistics = {}
-        stats = soup.find("h2", string="Statistics")
-        if stats:
-            for div in stats.find_next_siblings("div", class_="spaceit_pad"):
-                key = div.find("span", class_="dark_text")
-                if key:
-                    key_text = key.text.strip().rstrip(":")
-                    value = div.text.replace(key.text, "").strip()
+        stats = sections.get("Statistics")
+        if stats is not None:
+            for div in _section_divs(stats, "spaceit_pad"):
+                key = _first(DARK_TEXT_XPATH, div)
+                if key is not None:
+                    key_label = key.text_content()
+                    key_text = key_label.strip().rstrip(":")
+                    value = div.text_content().replace(key_label, "").strip()
 
                     # Special handling for Ranked field
                     if key_text == "Ranked":
@@ -210,150 +430,137 @@ class MALDataTransformer(IDataTransformer):
                     statistics[key_text] = value
         return statistics
 
-    def _extract_available_at(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_available_at(self, sections: Dict[str, List[HtmlElement]]) -> List[Dict]:
         available = []
-        available_section = soup.find("h2", string="Available At")
-        if available_section:
-            links_div = available_section.find_next_sibling("div")
-            if links_div:
-                for link in links_div.find_all("a"):
+        available_section = sections.get("Available At")
+        if available_section is not None:
+            links_div = next(_section_divs(available_section), None)
+            if links_div is not None:
+                for link in ANCHORS_XPATH(links_div):
                     available.append(
-                        {"url": link.get("href", ""), "title": link.text.strip()}
+                        {"url": link.get("href", ""), "title": link.text_content().strip()}
                     )
         return available
 
-    def _extract_resources(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_resources(self, sections: Dict[str, List[HtmlElement]]) -> List[Dict]:
         resources = []
-        resources_header = soup.find("h2", string="Resources")
-        if resources_header:
-            external_links = resources_header.find_next_sibling(
-                "div", class_="external_links"
-            )
-            if external_links:
+        resources_section = sections.get("Resources")
+        if resources_section is not None:
+            external_links = next(_section_divs(resources_section, "external_links"), None)
+            if external_links is not None:
                 # Get direct visible links (AniDB, ANN)
-                direct_links = external_links.find_all(
-                    "a", class_="link", recursive=False
-                )
-                for link in direct_links:
-                    caption = link.find("div", class_="caption")
-                    if caption:
+                for link in DIRECT_LINKS_XPATH(external_links):
+                    caption = _first(CAPTION_XPATH, link)
+                    if caption is not None:
                         resources.append(
-                            {"url": link.get("href", ""), "title": caption.text.strip()}
+                            {
+                                "url": link.get("href", ""),
+                                "title": caption.text_content().strip(),
+                            }
                         )
 
                 # Get all hidden links from js-links div
-                js_links = external_links.find(
-                    "div", {"class": "js-links", "data-rel": "resource"}
-                )
-                if js_links:
-                    hidden_links = js_links.find_all("a", class_="link")
-                    for link in hidden_links:
-                        caption = link.find("div", class_="caption")
-                        if caption:
+                js_links = _first(JS_LINKS_XPATH, external_links)
+                if js_links is not None:
+                    for link in LINKS_XPATH(js_links):
+                        caption = _first(CAPTION_XPATH, link)
+                        if caption is not None:
                             resources.append(
                                 {
                                     "url": link.get("href", ""),
-                                    "title": caption.text.strip(),
+                                    "title": caption.text_content().strip(),
                                 }
                             )
         return resources
 
-    def _extract_theme_songs(self, soup: BeautifulSoup) -> Dict:
-        songs = {"opening": [], "ending": []}
-
-        # Opening themes
-        opening_div = soup.find("div", {"class": "theme-songs js-theme-songs opnening"})
-        if opening_div:
-            for row in opening_div.find_all("tr"):
-                title = row.find("span", class_="theme-song-title")
-                artist = row.find("span", class_="theme-song-artist")
-                episode = row.find("span", class_="theme-song-episode")
-
-                if title:
-                    songs["opening"].append(
-                        {
-                            "title": title.text.strip('"'),
-                            "artist": (
-                                artist.text.replace(" by", "").strip() if artist else ""
-                            ),
-                            "episode": episode.text.strip("()") if episode else "",
-                        }
-                    )
-
-        # Ending themes
-        ending_div = soup.find("div", {"class": "theme-songs js-theme-songs ending"})
-        if ending_div:
-            for row in ending_div.find_all("tr"):
-                title = row.find("span", class_="theme-song-title")
-                artist = row.find("span", class_="theme-song-artist")
-                episode = row.find("span", class_="theme-song-episode")
+    def _extract_theme_songs(self, tree: HtmlElement) -> Dict:
+        # MAL's class name for the openings block really is misspelled
+        return {
+            "opening": self._extract_songs(tree, "opnening"),
+            "ending": self._extract_songs(tree, "ending"),
+        }
 
-                if title:
-                    songs["ending"].append(
-                        {
-                            "title": title.text.strip('"'),
-                            "artist": (
-                                artist.text.replace(" by", "").strip() if artist else ""
-                            ),
-                            "episode": episode.text.strip("()") if episode else "",
-                        }
-                    )
+    @staticmethod
+    def _extract_songs(tree: HtmlElement, song_type: str) -> List[Dict]:
+        songs_div = _first(
+            THEME_SONGS_XPATH, tree, classes=f"theme-songs js-theme-songs {song_type}"
+        )
+        if songs_div is None:
+            return []
 
+        songs = []
+        for row in ROWS_XPATH(songs_div):
+            title = _first(THEME_SONG_TITLE_XPATH, row)
+            if title is None:
+                continue
+            artist = _first(THEME_SONG_ARTIST_XPATH, row)
+            episode = _first(THEME_SONG_EPISODE_XPATH, row)
+            songs.append(
+                {
+                    "title": title.text_content().strip('"'),
+                    "artist": (
+                        artist.text_content().replace(" by", "").strip()
+                        if artist is not None
+                        else ""
+                    ),
+                    "episode": (
+                        episode.text_content().strip("()") if episode is not None else ""
+                    ),
+                }
+            )
         return songs
 
-    def _extract_related_entries(self, soup: BeautifulSoup) -> Dict:
+    def _extract_related_entries(self, tree: HtmlElement) -> Dict:
         related = {"tile": [], "table": {}}
 
-        entries_tile = soup.find("div", class_="entries-tile")
-        if entries_tile:
-            for entry in entries_tile.find_all("div", class_="entry"):
+        entries_tile = _first(ENTRIES_TILE_XPATH, tree)
+        if entries_tile is not None:
+            for entry in ENTRY_XPATH(entries_tile):
                 # Get relation and format
-                relation_div = entry.find("div", class_="relation")
-                if relation_div:
+                relation_div = _first(RELATION_XPATH, entry)
+                if relation_div is not None:
                     # Clean and combine relation text
-                    relation_text = " ".join(relation_div.get_text(strip=True).split())
+                    relation_text = " ".join(_joined_stripped_text(relation_div).split())
                     relation_type = relation_text.split()[0]
                     relation_format = relation_text.split()[1].strip("()")
                     relation = f"{relation_type} ({relation_format})"
 
                     # Get title and URL
-                    title_div = entry.find("div", class_="title")
-                    if title_div and title_div.find("a"):
-                        link = title_div.find("a")
+                    title_div = _first(ENTRY_TITLE_XPATH, entry)
+                    link = (
+                        _first(FIRST_ANCHOR_XPATH, title_div)
+                        if title_div is not None
+                        else None
+                    )
+                    if link is not None:
                         related["tile"].append(
                             {
                                 "relation": relation,
-                                "title": link.get_text(strip=True),
+                                "title": _joined_stripped_text(link),
                                 "url": link.get("href", ""),
                             }
                         )
 
         return related
 
-    def _extract_streaming_platforms(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_streaming_platforms(self, tree: HtmlElement) -> List[Dict]:
         platforms = []
-        broadcasts = soup.find("div", class_="broadcasts")
+        broadcasts = _first(BROADCASTS_XPATH, tree)
 
-        if broadcasts:
-            for item in broadcasts.find_all("a", class_="broadcast-item"):
+        if broadcasts is not None:
+            for item in BROADCAST_ITEM_XPATH(broadcasts):
                 platforms.append(
                     {"url": item.get("href", ""), "title": item.get("title", "")}
                 )
 
         return platforms
 
-    def _extract_genres(self, soup: BeautifulSoup) -> List[str]:
-        genres = []
-        genre_spans = soup.find_all("span", {"itemprop": "genre"})
-
-        if genre_spans:
-            genres = [span.text.strip() for span in genre_spans]
+    def _extract_genres(self, tree: HtmlElement) -> List[str]:
+        return [span.text_content().strip() for span in GENRE_XPATH(tree)]
 
-        return genres
-
-    def _extract_rating(self, soup: BeautifulSoup) -> Optional[Dict]:
-        rating_value = self._get_text(soup, 'span[itemprop="ratingValue"]')
-        rating_count = self._get_text(soup, 'span[itemprop="ratingCount"]')
+    def _extract_rating(self, tree: HtmlElement) -> Optional[Dict]:
+        rating_value = self._get_text(tree, RATING_VALUE_XPATH)
+        rating_count = self._get_text(tree, RATING_COUNT_XPATH)
 
         if not rating_value or not rating_count:
             return None
@@ -366,18 +573,10 @@ class MALDataTransformer(IDataTransformer):
             "worstRating": "1",
         }
 
-    def _extract_breadcrumbs(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_breadcrumbs(self) -> List[Dict]:
+        # Only the last crumb depends on the anime
         return [
-            {
-                "_type": "http://schema.org/ListItem",
-                "item": "https://myanimelist.net/",
-                "position": "1",
-            },
-            {
-                "_type": "http://schema.org/ListItem",
-                "item": "https://myanimelist.net/anime.php",
-                "position": "2",
-            },
+            *STATIC_BREADCRUMBS,
             {
                 "_type": "http://schema.org/ListItem",
                 "item": f"https://myanimelist.net/anime/{self.mal_id}",
@@ -385,109 +584,90 @@ class MALDataTransformer(IDataTransformer):
             },
         ]
 
-    def _get_song_elements(self, soup: BeautifulSoup, song_type: str) -> List[tuple]:
-        elements = []
-        songs_div = soup.find("div", class_=f"theme-songs js-theme-songs {song_type}")
-        if songs_div:
-            for row in songs_div.select("tr"):
-                title = row.select_one(".theme-song-title")
-                artist = row.select_one(".theme-song-artist")
-                episode = row.select_one(".theme-song-episode")
-                if all([title, artist, episode]):
-                    elements.append((title, artist, episode))
-        return elements
-
-    def _extract_alternative_titles(self, soup: BeautifulSoup) -> Dict:
-        titles = {
-            "Synonyms": "",
-            "Japanese": "",
-            "English": "",
-            "German": "",
-            "Spanish": "",
-            "French": "",
-        }
+    def _extract_alternative_titles(
+        self, tree: HtmlElement, sections: Dict[str, List[HtmlElement]]
+    ) -> Dict:
+        titles = dict.fromkeys(ALTERNATIVE_TITLE_KEYS, "")
 
         # Get Synonyms and Japanese from main section
-        main_titles = soup.find("h2", string="Alternative Titles")
-        if main_titles:
-            for div in main_titles.find_next_siblings("div", class_="spaceit_pad"):
-                label = div.find("span", class_="dark_text")
-                if label:
-                    key = label.text.strip().rstrip(":")
-                    if key in ["Synonyms", "Japanese"]:
-                        titles[key] = div.text.replace(label.text, "").strip()
+        main_titles = sections.get("Alternative Titles")
+        if main_titles is not None:
+            for div in _section_divs(main_titles, "spaceit_pad"):
+                label = _first(DARK_TEXT_XPATH, div)
+                if label is not None:
+                    label_text = label.text_content()
+                    key = label_text.strip().rstrip(":")
+                    if key in MAIN_TITLE_KEYS:
+                        titles[key] = div.text_content().replace(label_text, "").strip()
 
         # Get other language titles from hidden section
-        alt_titles = soup.find("div", class_="js-alternative-titles")
-        if alt_titles:
-            for div in alt_titles.find_all("div", class_="spaceit_pad"):
-                label = div.find("span", class_="dark_text")
-                if label:
-                    key = label.text.strip().rstrip(":")
+        alt_titles = _first(ALT_TITLES_XPATH, tree)
+        if alt_titles is not None:
+            for div in SPACEIT_PAD_XPATH(alt_titles):
+                label = _first(DARK_TEXT_XPATH, div)
+                if label is not None:
+                    label_text = label.text_content()
+                    key = label_text.strip().rstrip(":")
                     if key in titles:
-                        titles[key] = div.text.replace(label.text, "").strip()
+                        titles[key] = div.text_content().replace(label_text, "").strip()
 
         return titles
 
-    def _extract_information(self, soup: BeautifulSoup) -> Dict:
-        info = {
-            "Type": "",
-            "Episodes": "",
-            "Status": "",
-            "Aired": "",
-            "Premiered": "",
-            "Broadcast": "",
-            "Producers": "",
-            "Licensors": "",
-            "Studios": "",
-            "Source": "",
-            "Genres": "",
-            "Theme": "",
-            "Demographic": "",
-            "Duration": "",
-            "Rating": "",
-        }
-
-        info_section = soup.find("h2", string="Information")
-        if info_section:
-            for div in info_section.find_next_siblings("div", class_="spaceit_pad"):
-                label = div.find("span", class_="dark_text")
-                if label:
-                    key = label.text.strip().rstrip(":")
+    def _extract_information(
+        self, tree: HtmlElement, sections: Dict[str, List[HtmlElement]]
+    ) -> Dict:
+        info = dict.fromkeys(INFORMATION_KEYS, "")
+
+        info_section = sections.get("Information")
+        if info_section is not None:
+            for div in _section_divs(info_section, "spaceit_pad"):
+                label = _first(DARK_TEXT_XPATH, div)
+                if label is not None:
+                    label_text = label.text_content()
+                    key = label_text.strip().rstrip(":")
                     if key == "Genres":
-                        genres = self._extract_genres(soup)
+                        genres = self._extract_genres(tree)
                         info[key] = ", ".join(genres)
                     elif key in info:
-                        value = div.text.replace(label.text, "").strip()
+                        value = div.text_content().replace(label_text, "").strip()
                         info[key] = value
 
         return info
 
-    # This method searches the soup object (which represents the parsed HTML)
-    def _extract_characters_voice_actors_list(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extracts voice actors for each character from the Characters & Staff page, including character and voice actor IDs."""
+    # This method searches the parsed anime page for the Characters & Staff link
+    def _extract_characters_voice_actors_list(
+        self, tree: HtmlElement, prefetched: Optional[Dict[str, Any]] = None
+    ) -> List[Dict]:
+        """
+        Extracts voice actors for each character from the Characters & Staff page, including character and voice actor IDs.
+        Uses `prefetched` (a scrape result) when it is that page, instead of fetching it again.
+        Without a scraper (in a parse worker), asks the caller for the page instead.
+        """
         voice_actors_data = []
 
         # Find the link to the Characters & Staff page.
-        characters_staff_link = soup.find("a", href=re.compile(r"/characters$"))
-        if not characters_staff_link:
+        characters_staff_link = _first(CHARACTERS_LINK_XPATH, tree)
+        if characters_staff_link is None:
             logging.warning(
                 f"No Characters & Staff link found for anime ID {self.mal_id}"
             )
             return []  # Return empty list if no link is found.
-        characters_staff_url = characters_staff_link["href"]
+        characters_staff_url = characters_staff_link.get("href")
 
         try:
-            # Fetch the Characters & Staff page.
-            char_staff = MALScraper.scrape(characters_staff_url)
+            # Fetch the Characters & Staff page unless the pipeline already did.
+            if prefetched and prefetched["url"] == characters_staff_url:
+                char_staff = prefetched
+            elif self.data_scraper is None:
+                return CharactersPageRequest(characters_staff_url)
+            else:
+                char_staff = self.data_scraper.scrape(characters_staff_url)
             if char_staff is None:
                 logging.error("Failed to fetch the Characters & Staff page")
                 return []
-            char_staff_soup = BeautifulSoup(char_staff["html"], "html.parser")
+            char_staff_tree = lxml.html.fromstring(char_staff["html"], parser=HTML_PARSER)
             # Find each table representing a character.
-            character_tables = char_staff_soup.find_all(
-                "table", class_="js-anime-character-table"
-            )
+            character_tables = CHARACTER_TABLES_XPATH(char_staff_tree)
 
             if not character_tables:
                 return None
@@ -495,11 +675,11 @@ class MALDataTransformer(IDataTransformer):
             for table in character_tables:
                 character_obj = {}
                 # Extract the character URL from the <a> tag with /character/ in href.
-                char_link = table.find("a", href=re.compile(r"/character/"))
-                if char_link:
-                    char_url = char_link["href"]
+                char_link = _first(CHARACTER_LINK_XPATH, table)
+                if char_link is not None:
+                    char_url = char_link.get("href")
                     # Extract the numeric character ID using regex.
-                    match = re.search(r"/character/(\d+)", char_url)
+                    match = CHARACTER_ID_PATTERN.search(char_url)
                     character_obj["characterId"] = match.group(1) if match else ""
                 else:
                     character_obj["characterId"] = ""
@@ -507,21 +687,22 @@ class MALDataTransformer(IDataTransformer):
                 # Initialize the list for this character's voice actors.
                 voice_actor_list = []
                 # Each voice actor row has the class 'js-anime-character-va-lang'.
-                va_rows = table.find_all("tr", class_="js-anime-character-va-lang")
-                for row in va_rows:
-                    name_td = row.find("td", align="right")
-                    if not name_td:
+                for row in VA_ROWS_XPATH(table):
+                    name_td = _first(VA_NAME_CELL_XPATH, row)
+                    if name_td is None:
                         continue
-                    va_link = name_td.find("a", href=re.compile(r"/people/"))
-                    if va_link:
-                        va_url = va_link["href"]
+                    va_link = _first(VA_LINK_XPATH, name_td)
+                    if va_link is not None:
+                        va_url = va_link.get("href")
                         # Extract the numeric voice actor ID from the URL.
-                        match_va = re.search(r"/people/(\d+)", va_url)
+                        match_va = PEOPLE_ID_PATTERN.search(va_url)
                         va_id = match_va.group(1) if match_va else ""
                     else:
                         va_id = ""
-                    lang_div = name_td.find("div", class_="js-anime-character-language")
-                    va_language = lang_div.text.strip() if lang_div else ""
+                    lang_div = _first(VA_LANGUAGE_XPATH, name_td)
+                    va_language = (
+                        lang_div.text_content().strip() if lang_div is not None else ""
+                    )
 
                     # Append the voice actor's details: ID and language.
                     voice_actor_list.append(
@@ -550,11 +731,11 @@ class JSONDataStorage(IDataStorage):
             # Write data atomically
             temp_path = f"{output_path}.tmp"
 
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(temp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             Path(temp_path).replace(output_path)
 
-            logging.debug(f"Successfully wrote data to {output_path}")
+            logging.debug("Successfully wrote data to %s", output_path)
         except Exception as e:
             logging.error(f"Failed to write JSON file: {e}")
             raise IOError(f"Failed to write JSON file: {e}")
@@ -562,12 +743,64 @@ class JSONDataStorage(IDataStorage):
     def store_all(self, records: List[Dict], output_path: str) -> None:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for record in records:
-                # Write each record as single line without spaces between fields
-                f.write(
-                    json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
-                )
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            # orjson writes compact UTF-8 lines, one record per line
+            f.writelines(orjson.dumps(record) + b"\n" for record in records)
+
+
+class NDJSONShardStorage(IDataStorage):
+    """Appends records to rolling NDJSON shards instead of one file per record"""
+
+    def __init__(
+        self,
+        output_dir: str,
+        shard_prefix: str = "anime",
+        max_shard_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.output_dir = Path(output_dir)
+        self.shard_prefix = shard_prefix
+        self.max_shard_bytes = max_shard_bytes
+        self._shard = None
+        self._shard_idx = 0
+        self._shard_bytes = 0
+
+    def _shard_path(self, idx: int) -> Path:
+        return self.output_dir / f"{self.shard_prefix}-{idx:05d}.ndjson"
+
+    def _open_shard(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Resume appending to the newest shard left by a previous run
+        while self._shard_path(self._shard_idx + 1).exists():
+            self._shard_idx += 1
+        path = self._shard_path(self._shard_idx)
+        self._shard = open(path, "ab", buffering=1 << 20)
+        self._shard_bytes = path.stat().st_size
+
+    def store(self, data: Dict[str, Any], output_path: str = None) -> None:
+        if self._shard is None:
+            self._open_shard()
+        line = orjson.dumps(data) + b"\n"
+        self._shard.write(line)
+        self._shard_bytes += len(line)
+
+        # Roll over to a new shard once this one is big enough
+        if self._shard_bytes >= self.max_shard_bytes:
+            self.close()
+            self._shard_idx += 1
+
+    def store_all(self, records: List[Dict], output_path: str = None) -> None:
+        for record in records:
+            self.store(record)
+        self.flush()
+
+    def flush(self) -> None:
+        if self._shard is not None:
+            self._shard.flush()
+
+    def close(self) -> None:
+        if self._shard is not None:
+            self._shard.close()
+            self._shard = None
 
 
 class MALAnimeScraper:
@@ -587,7 +820,7 @@ class MALAnimeScraper:
         try:
             # Generate URL
             url = self.url_generator.generate(mal_id)
-            logging.debug(f"Generated URL: {url}")
+            logging.debug("Generated URL: %s", url)
 
             # Scrape raw data
             raw_data = self.data_scraper.scrape(url)
@@ -598,7 +831,7 @@ class MALAnimeScraper:
             # Transform data
             transformed_data = self.data_transformer.transform(raw_data, mal_id)
             self.data_storage.store(transformed_data, output_path)
-            logging.debug(f"Data stored to {output_path}")
+            logging.debug("Data stored to %s", output_path)
 
         except Exception as e:
             logging.error(f"Error in scrape_and_store: {e}")
@@ -609,20 +842,63 @@ class MALAnimeScraper:
         raw_data = self.data_scraper.scrape(url)
         return self.data_transformer.transform(raw_data, mal_id)
 
+    async def _fetch_pages(
+        self, client: aiohttp.ClientSession, url: str, page_url: Optional[str]
+    ) -> tuple:
+        """
+        Fetch an anime page and its Characters & Staff page, so the transform
+        thread never blocks on a second request.
+
+        The listing link carries the title slug the Characters & Staff link is
+        built from, so with it both pages are fetched concurrently; otherwise
+        the link is looked up in the fetched page.
+        """
+        if page_url:
+            return await asyncio.gather(
+                self.data_scraper.scrape_async(url, client),
+                self.data_scraper.scrape_async(f"{page_url}/characters", client),
+            )
+        raw_data = await self.data_scraper.scrape_async(url, client)
+        characters_link = (
+            CHARACTERS_LINK_PATTERN.search(raw_data["html"]) if raw_data else None
+        )
+        if not characters_link:
+            return raw_data, None
+        return raw_data, await self.data_scraper.scrape_async(
+            characters_link.group(1).decode(), client
+        )
+
+    def _finish(self, checkpoint) -> None:
+        """Close storage, then save and close the checkpoint."""
+        try:
+            self.data_storage.close()
+        finally:
+            checkpoint.save_checkpoint()
+            checkpoint.close()
+
     async def scrape_all_anime(
         self,
         output_prefix: str = "anime_data",
         checkpoint_path: str = "anime_checkpoint.json",
-        save_checkpoint_interval: int = 1,  # Save checkpoint after every N successful scrapes
+        save_checkpoint_interval: int = 1,  # Flush records and checkpoint after every N successful scrapes
+        fetch_workers: int = 4,
     ) -> None:
         """
         Asynchronously paginate through all anime and scrape each one.
         Supports checkpointing to resume from where it left off.
 
+        Pagination feeds a bounded queue drained by `fetch_workers` scrape
+        workers; a single writer stores records. Stored IDs are marked
+        completed only after the storage is flushed, so batching storages
+        (NDJSON shards, JSONL uploads) never checkpoint records they have
+        not written out.
+
         Args:
             output_prefix (str): The prefix for the output files
             checkpoint_path (str): Path to the checkpoint file
-            save_checkpoint_interval (int): How often to save the checkpoint
+            save_checkpoint_interval (int): How often to flush stored records; checkpoint
+                saves are coalesced to at most one per this many completed IDs or 30 seconds
+            fetch_workers (int): Number of anime scraped concurrently
         """
 
         # Initialize checkpoint handler
@@ -630,59 +906,148 @@ class MALAnimeScraper:
         successful_scrapes = 0
         Path(os.path.dirname(output_prefix)).mkdir(parents=True, exist_ok=True)
 
-        async with aiohttp.ClientSession() as client:
-            async for anime in paginate_anime(client, checkpoint):
-                try:
-                    anime_id = anime["id"]
+        anime_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        record_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        # Stored but not yet flushed, so not yet safe to checkpoint
+        pending_ids: List[int] = []
+
+        # Parsing is CPU-bound, so it runs in worker processes to use every
+        # core and keep the GIL free for the event loop
+        parse_pool = ProcessPoolExecutor()
+        loop = asyncio.get_running_loop()
 
+        async def fetch_worker(client: aiohttp.ClientSession) -> None:
+            while True:
+                anime = await anime_queue.get()
+                anime_id = anime["id"]
+                try:
                     # Skip if already completed
                     if checkpoint.is_completed(anime_id):
-                        logging.debug(
-                            f"Skipping already processed anime ID: {anime_id}"
-                        )
+                        logging.debug("Skipping already processed anime ID: %d", anime_id)
                         continue
 
-                    # Scrape the anime
-                    logging.info(f"Scraping anime ID: {anime_id} - {anime['title']}")
-                    record = self.scrape(anime_id)
-
-                    if record:
-                        # Define a unique output path for each anime
-                        file_path = f"{output_prefix}/{anime_id}.json"
-                        self.data_storage.store(record, file_path)
-
-                        # Mark as completed and update checkpoint
-                        checkpoint.mark_completed(anime_id)
-                        successful_scrapes += 1
-
-                        # Periodically save the checkpoint
-                        if successful_scrapes % save_checkpoint_interval == 0:
-                            checkpoint.save_checkpoint()
-
-                        logging.info(
-                            f"Scraped and stored anime {anime_id} (Total: {checkpoint.get_completed_count()})"
+                    # Fetch over the shared session, then parse in the process pool
+                    logging.info("Scraping anime ID: %d - %s", anime_id, anime["title"])
+                    url = self.url_generator.generate(anime_id)
+                    raw_data, characters_page = await self._fetch_pages(
+                        client, url, anime.get("page_url")
+                    )
+                    if not raw_data:
+                        raise ValueError(f"Failed to scrape data for ID {anime_id}")
+                    raw_data["characters_page"] = characters_page
+                    # Each call gets its own unpickled copy of the transformer,
+                    # so its per-ID state is never shared between workers
+                    record = await loop.run_in_executor(
+                        parse_pool, self.data_transformer.transform, raw_data, anime_id
+                    )
+                    if isinstance(record, CharactersPageRequest):
+                        # The page links a different Characters & Staff URL;
+                        # fetch it here, through the shared rate limiter
+                        characters_page = await self.data_scraper.scrape_async(
+                            record.url, client
+                        )
+                        if not characters_page:
+                            raise ValueError(
+                                f"Failed to fetch Characters & Staff page for ID {anime_id}"
+                            )
+                        raw_data["characters_page"] = characters_page
+                        record = await loop.run_in_executor(
+                            parse_pool, self.data_transformer.transform, raw_data, anime_id
                         )
+                    if record:
+                        await record_queue.put((anime_id, record))
 
                 except Exception as e:
+                    # Network errors are already retried with exponential backoff
                     logging.error(f"Error scraping anime {anime_id}: {e}")
-                    # Pause a bit longer on error
-                    await asyncio.sleep(5)
-                    continue
+                finally:
+                    anime_queue.task_done()
 
-            # Final checkpoint save after complete
-            checkpoint.save_checkpoint()
+        async def writer() -> None:
+            nonlocal successful_scrapes
+            while True:
+                anime_id, record = await record_queue.get()
+                try:
+                    # Define a unique output path for each anime
+                    file_path = f"{output_prefix}/{anime_id}.json"
+                    # Storage may block (GCS uploads), so it runs in a thread;
+                    # there is one writer, so calls never overlap
+                    await asyncio.to_thread(self.data_storage.store, record, file_path)
+                    pending_ids.append(anime_id)
+                    successful_scrapes += 1
+                    logging.info("Scraped and stored anime %d", anime_id)
+
+                    # Periodically flush stored records and checkpoint them
+                    if successful_scrapes % save_checkpoint_interval == 0:
+                        await flush_pending()
+                except Exception as e:
+                    logging.error(f"Error storing anime {anime_id}: {e}")
+                finally:
+                    record_queue.task_done()
+
+        async def flush_pending() -> None:
+            if not pending_ids:
+                return
+            try:
+                await asyncio.to_thread(self.data_storage.flush)
+            except Exception as e:
+                # IDs stay pending and are checkpointed after the next successful flush
+                logging.error(f"Error flushing anime records: {e}")
+                return
+            for anime_id in pending_ids:
+                checkpoint.mark_completed(anime_id)
+            pending_ids.clear()
             logging.info(
-                f"Anime scraping completed. Total processed: {checkpoint.get_completed_count()}"
+                f"Checkpointed stored anime (Total: {checkpoint.get_completed_count()})"
+            )
+
+        async def drain() -> None:
+            # Finish the current page before pagination checkpoints the next one
+            await anime_queue.join()
+            await record_queue.join()
+            await flush_pending()
+
+        # Keep-alive connections to MAL are reused by every worker
+        async with make_session(fetch_workers + 1) as client:
+            workers = [
+                asyncio.create_task(fetch_worker(client)) for _ in range(fetch_workers)
+            ]
+            workers.append(asyncio.create_task(writer()))
+            # Saves the checkpoint off the event loop, coalescing changes
+            workers.append(
+                asyncio.create_task(checkpoint.run_flusher(save_checkpoint_interval))
             )
+            try:
+                # Listing pages share the entry pages' rate limit
+                async for batch in paginate_anime(
+                    client,
+                    checkpoint,
+                    before_next_page=drain,
+                    limiter=getattr(self.data_scraper, "limiter", None),
+                ):
+                    for anime in batch:
+                        await anime_queue.put(anime)
+                await drain()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+                # Final save runs even if the scrape failed or was cancelled,
+                # and off the event loop like the periodic ones
+                await asyncio.to_thread(self._finish, checkpoint)
+
+        logging.info(
+            f"Anime scraping completed. Total processed: {checkpoint.get_completed_count()}"
+        )
 
     def get_anime_checkpoint_status(
         self, checkpoint_path: str = "anime_checkpoint.json"
     ) -> Dict:
         """Get information about the current anime checkpoint status."""
-        from .anime_checkpoint import AnimeCheckpointHandler
-
         checkpoint = AnimeCheckpointHandler(checkpoint_path)
         letter, page = checkpoint.get_pagination_state()
+        checkpoint.close()
 
         return {
             "checkpoint_file": checkpoint_path,
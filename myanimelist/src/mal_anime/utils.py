@@ -2,45 +2,180 @@ import re
 import aiohttp
 import asyncio
 import logging
-from typing import AsyncGenerator, Dict, Any
+import lxml.html
+import os
+import threading
+import uuid
+from collections import deque
+from contextlib import aclosing
+from urllib.parse import urlsplit
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Any, List, Optional, Tuple
+from tenacity import RetryCallState, retry, stop_never, wait_random_exponential
+from .retry import HostRateLimiter
 
 BASE_URL = "https://myanimelist.net"
+# Rate limiter key for every request to BASE_URL
+BASE_HOST = urlsplit(BASE_URL).netloc
+# Entry URLs are these prefixes plus the ID
+ANIME_URL_PREFIX = f"{BASE_URL}/anime/"
+PEOPLE_URL_PREFIX = f"{BASE_URL}/people/"
 PAGE_SIZE = 50
-# Using 1-based indexing letters (excluding ".")
-LETTERS = [l for l in ".ABCDEFGHIJKLMNOPQRSTUVWXYZ" if l != "."]
+# Listing pages requested ahead of the one being processed
+PREFETCH_PAGES = 2
+# Listing letters, in pagination order (MAL's "." bucket is not scraped)
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Position of each letter, for resuming; a dict rather than `in LETTERS`,
+# which would also accept substrings like "AB"
+LETTER_INDEX = {letter: idx for idx, letter in enumerate(LETTERS)}
+
+# MAL serves UTF-8; fetched pages stay as bytes and are decoded by libxml2
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def has_class(name: str) -> str:
+    # XPath equivalent of bs4's class_= match on one class token
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Record IDs are cut from one urandom read per batch instead of one per record
+AIRBYTE_ID_BATCH = 1024
+_airbyte_ids: List[str] = []
+# Transforms run on a thread pool; the refill and the pop must not interleave
+_airbyte_ids_lock = threading.Lock()
+
+
+def _reset_airbyte_ids() -> None:
+    # A forked parse worker must not hand out the parent's leftover IDs, and
+    # gets a fresh lock in case another thread held it at fork time
+    global _airbyte_ids_lock
+    _airbyte_ids.clear()
+    _airbyte_ids_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_airbyte_ids)
+
+
+def next_airbyte_id() -> str:
+    """Random (version 4) UUID string for a record's _airbyte_ab_id."""
+    with _airbyte_ids_lock:
+        if not _airbyte_ids:
+            raw = os.urandom(16 * AIRBYTE_ID_BATCH)
+            _airbyte_ids.extend(
+                str(uuid.UUID(bytes=raw[i : i + 16], version=4))
+                for i in range(0, len(raw), 16)
+            )
+        return _airbyte_ids.pop()
+
+
+# Listing pages are scanned as raw bytes, so the patterns are bytes too and
+# only the captured strings are ever decoded
 
 # This regex will find IDs from URLs like '/people/12345/'
-STAFF_ID_PATTERN = re.compile(r"/people/(\d+)/")
+STAFF_ID_PATTERN = re.compile(rb"/people/(\d+)/")
 
-# New regex pattern to find anime entries
+# New regex pattern to find anime entries; captures the full link (with its
+# title slug), the ID and the title
 ANIME_PATTERN = re.compile(
-    r'<a class="hoverinfo_trigger[^"]+" href="https://myanimelist\.net/anime/(\d+)[^"]+"[^>]+><strong>([^<]+)</strong>'
+    rb'<a class="hoverinfo_trigger[^"]+" href="(https://myanimelist\.net/anime/(\d+)[^"]+)"[^>]+><strong>([^<]+)</strong>'
+)
+
+
+def _log_listing_error(retry_state: RetryCallState) -> None:
+    _, _, kind, letter, page = retry_state.args
+    logging.error(
+        f"Error fetching {kind} page {letter}-{page}: {retry_state.outcome.exception()}"
+    )
+
+
+# A listing page is never skipped, since that would silently drop its entries;
+# failures back off exponentially with full jitter. Retry-After and rate-limit
+# headers reach the limiter before the status is checked, so the next attempt
+# also waits for the host's slot.
+@retry(
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_never,
+    before_sleep=_log_listing_error,
 )
+async def _fetch_listing(
+    client: aiohttp.ClientSession,
+    limiter: HostRateLimiter,
+    kind: str,
+    letter: str,
+    page: int,
+) -> bytes:
+    url = f"{BASE_URL}/{kind}.php"
+    params = {"letter": letter, "show": page * PAGE_SIZE}
+    logging.info("Fetching %s: letter=%s, page=%d", kind, letter, page)
+    await limiter.wait(BASE_HOST)
+    async with client.get(url, params=params) as response:
+        limiter.update(BASE_HOST, response.headers)
+        response.raise_for_status()
+        return await response.read()
+
+
+async def _listing_pages(
+    client: aiohttp.ClientSession,
+    limiter: HostRateLimiter,
+    kind: str,
+    letter: str,
+    start_page: int,
+) -> AsyncGenerator[Tuple[int, bytes], None]:
+    """
+    Yield (page, html) for one letter's listing pages in order, keeping
+    PREFETCH_PAGES requests in flight ahead of the page being processed.
+    Runs until the caller stops iterating; pages still in flight are cancelled.
+    """
+    in_flight: deque = deque()
+    next_page = start_page
+    try:
+        while True:
+            while len(in_flight) <= PREFETCH_PAGES:
+                fetch = asyncio.create_task(
+                    _fetch_listing(client, limiter, kind, letter, next_page)
+                )
+                in_flight.append((next_page, fetch))
+                next_page += 1
+            page, fetch = in_flight.popleft()
+            yield page, await fetch
+    finally:
+        for _, fetch in in_flight:
+            fetch.cancel()
 
 
 async def paginate_anime(
     client: aiohttp.ClientSession,
     checkpoint_handler=None,
-) -> AsyncGenerator[Dict[str, Any], None]:
+    before_next_page: Optional[Callable[[], Awaitable[None]]] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
     """
     Asynchronously paginate through anime listings.
-    Yields a dictionary with id, title, and url for each anime.
+    Yields one list per listing page, holding a dictionary with id, title,
+    url and page_url (the listing's link, including the title slug) for
+    each anime not yet processed.
 
     Args:
         client: aiohttp client session to use for requests
         checkpoint_handler: Optional checkpoint handler to track progress
+        before_next_page: Optional coroutine awaited before a new page is
+            checkpointed, so consumers can finish the previous page first
+        limiter: Rate limiter shared with the entry page requests; a private
+            one is used if not given
 
     Yields:
-        Dictionary containing id, title, and url of each anime found
+        The new anime of each listing page, as dictionaries containing id,
+        title, url and page_url
     """
+    limiter = limiter or HostRateLimiter()
+
     # Get starting position from checkpoint if available
     start_letter_idx = 0
     start_page = 0
 
     if checkpoint_handler:
         letter, page = checkpoint_handler.get_pagination_state()
-        if letter and letter in LETTERS:
-            start_letter_idx = LETTERS.index(letter)
+        if letter in LETTER_INDEX:
+            start_letter_idx = LETTER_INDEX[letter]
             start_page = page
             logging.info(
                 f"Resuming anime pagination from letter={letter} (index={start_letter_idx}), page={page}"
@@ -48,56 +183,62 @@ async def paginate_anime(
 
     # Start from where we left off in the alphabet
     for idx, letter in enumerate(LETTERS[start_letter_idx:], start_letter_idx):
-        page = start_page if idx == start_letter_idx else 0
-
-        while True:
-            url = f"{BASE_URL}/anime.php"
-            params = {"letter": letter, "show": page * PAGE_SIZE}
-            logging.info(f"Fetching anime: letter={letter}, page={page}")
-
-            try:
-                async with client.get(url, params=params) as response:
-                    response.raise_for_status()
-                    text = await response.text()
-            except Exception as e:
-                logging.error(f"Error fetching anime page {letter}-{page}: {e}")
-                # Wait a bit and retry this page
-                await asyncio.sleep(5)
-                continue
-
-            # Update checkpoint before processing this page
-            if checkpoint_handler:
-                checkpoint_handler.update_pagination(letter, page)
-
-            # Use the new pattern to find anime entries
-            anime_entries = ANIME_PATTERN.findall(text)
-
-            if not anime_entries:
-                logging.info(f"No more anime found for letter {letter}")
-                break
-
-            for anime_id, anime_title in anime_entries:
-                anime_id = int(anime_id)
-                anime_url = f"{BASE_URL}/anime/{anime_id}"
+        first_page = start_page if idx == start_letter_idx else 0
+
+        listing = _listing_pages(client, limiter, "anime", letter, first_page)
+        async with aclosing(listing) as pages:
+            async for page, html in pages:
+                # Update checkpoint before processing this page
+                if before_next_page:
+                    await before_next_page()
+                if checkpoint_handler:
+                    checkpoint_handler.update_pagination(letter, page)
+
+                # Use the new pattern to find anime entries
+                anime_entries = ANIME_PATTERN.findall(html)
+
+                if not anime_entries:
+                    logging.info(f"No more anime found for letter {letter}")
+                    break
+
+                # An anime linked twice on the page is kept once, with its
+                # first link and title, so it is never scraped twice
+                anime_by_id: Dict[int, Tuple[bytes, bytes]] = {}
+                for page_url, anime_id, anime_title in anime_entries:
+                    anime_by_id.setdefault(int(anime_id), (page_url, anime_title))
+
+                # One checkpoint lookup for the whole page
+                completed = (
+                    checkpoint_handler.completed_among(anime_by_id) if checkpoint_handler else ()
+                )
 
                 # Skip already processed IDs if checkpoint is available
-                if checkpoint_handler and checkpoint_handler.is_completed(anime_id):
-                    logging.debug(f"Skipping already processed anime ID: {anime_id}")
-                    continue
-
-                yield {
-                    "id": anime_id,
-                    "title": anime_title,
-                    "url": anime_url,
-                }
-
-            if len(anime_entries) < PAGE_SIZE:
-                logging.info(f"Reached end of letter {letter} at page {page}")
-                break
-
-            page += 1
-            # Small delay to avoid hitting rate limits
-            await asyncio.sleep(1)
+                batch = [
+                    {
+                        "id": anime_id,
+                        "title": anime_title.decode(),
+                        "url": ANIME_URL_PREFIX + str(anime_id),
+                        "page_url": page_url.decode(),
+                    }
+                    for anime_id, (page_url, anime_title) in anime_by_id.items()
+                    if anime_id not in completed
+                ]
+                if len(batch) < len(anime_by_id):
+                    logging.debug(
+                        "Skipping %d already processed anime on page %s-%d",
+                        len(anime_by_id) - len(batch),
+                        letter,
+                        page,
+                    )
+                # The whole page in one resume rather than one per entry
+                if batch:
+                    yield batch
+
+                # A short page ends the letter; counted before de-duplication,
+                # since a full page with a repeated anime still has more after it
+                if len(anime_entries) < PAGE_SIZE:
+                    logging.info(f"Reached end of letter {letter} at page {page}")
+                    break
 
     logging.info("Finished paginating through all anime")
 
@@ -105,26 +246,35 @@ async def paginate_anime(
 async def paginate_people(
     client: aiohttp.ClientSession,
     checkpoint_handler=None,
-) -> AsyncGenerator[str, None]:
+    before_next_page: Optional[Callable[[], Awaitable[None]]] = None,
+    limiter: Optional[HostRateLimiter] = None,
+) -> AsyncGenerator[List[Tuple[int, str]], None]:
     """
     Asynchronously paginate through people listings.
-    Yields the URL of each person.
+    Yields one list per listing page, holding the ID and URL of each
+    person not yet processed.
 
     Args:
         client: aiohttp client session to use for requests
         checkpoint_handler: Optional checkpoint handler to track progress
+        before_next_page: Optional coroutine awaited before a new page is
+            checkpointed, so consumers can finish the previous page first
+        limiter: Rate limiter shared with the entry page requests; a private
+            one is used if not given
 
     Yields:
-        URL of each person found in the pagination
+        The new people of each listing page, as (people_id, url) pairs
     """
+    limiter = limiter or HostRateLimiter()
+
     # Get starting position from checkpoint if available
     start_letter_idx = 0
     start_page = 0
 
     if checkpoint_handler:
         letter, page = checkpoint_handler.get_pagination_state()
-        if letter and letter in LETTERS:
-            start_letter_idx = LETTERS.index(letter)
+        if letter in LETTER_INDEX:
+            start_letter_idx = LETTER_INDEX[letter]
             start_page = page
             logging.info(
                 f"Resuming pagination from letter={letter} (index={start_letter_idx}), page={page}"
@@ -132,48 +282,51 @@ async def paginate_people(
 
     # Start from where we left off in the alphabet
     for idx, letter in enumerate(LETTERS[start_letter_idx:], start_letter_idx):
-        page = start_page if idx == start_letter_idx else 0
-
-        while True:
-            url = f"{BASE_URL}/people.php"
-            params = {"letter": letter, "show": page * PAGE_SIZE}
-            logging.info(f"Fetching people: letter={letter}, page={page}")
-
-            try:
-                async with client.get(url, params=params) as response:
-                    response.raise_for_status()
-                    text = await response.text()
-            except Exception as e:
-                logging.error(f"Error fetching people page {letter}-{page}: {e}")
-                # Wait a bit and retry this page
-                await asyncio.sleep(5)
-                continue
-
-            # Update checkpoint before processing this page
-            if checkpoint_handler:
-                checkpoint_handler.update_pagination(letter, page)
-
-            person_ids = STAFF_ID_PATTERN.findall(text)
-            if not person_ids:
-                logging.info(f"No more people found for letter {letter}")
-                break
-
-            for person_id in person_ids:
-                person_url = f"{BASE_URL}/people/{person_id}/"
+        first_page = start_page if idx == start_letter_idx else 0
+
+        listing = _listing_pages(client, limiter, "people", letter, first_page)
+        async with aclosing(listing) as pages:
+            async for page, html in pages:
+                # Update checkpoint before processing this page
+                if before_next_page:
+                    await before_next_page()
+                if checkpoint_handler:
+                    checkpoint_handler.update_pagination(letter, page)
+
+                person_links = STAFF_ID_PATTERN.findall(html)
+                # A person is linked more than once per row (photo and name);
+                # keep each ID once, in page order
+                person_ids = list(dict.fromkeys(map(int, person_links)))
+                if not person_ids:
+                    logging.info(f"No more people found for letter {letter}")
+                    break
+
+                # One checkpoint lookup for the whole page
+                completed = (
+                    checkpoint_handler.completed_among(person_ids) if checkpoint_handler else ()
+                )
 
                 # Skip already processed IDs if checkpoint is available
-                if checkpoint_handler and checkpoint_handler.is_completed(
-                    int(person_id)
-                ):
-                    logging.debug(f"Skipping already processed people ID: {person_id}")
-                    continue
-
-                yield person_url
-
-            if len(person_ids) < PAGE_SIZE:
-                logging.info(f"Reached end of letter {letter} at page {page}")
-                break
-
-            page += 1
+                batch = [
+                    (person_id, f"{PEOPLE_URL_PREFIX}{person_id}/")
+                    for person_id in person_ids
+                    if person_id not in completed
+                ]
+                if len(batch) < len(person_ids):
+                    logging.debug(
+                        "Skipping %d already processed people on page %s-%d",
+                        len(person_ids) - len(batch),
+                        letter,
+                        page,
+                    )
+                # The whole page in one resume rather than one per entry
+                if batch:
+                    yield batch
+
+                # A short page ends the letter; counted before de-duplication,
+                # so a full page is never mistaken for the last one
+                if len(person_links) < PAGE_SIZE:
+                    logging.info(f"Reached end of letter {letter} at page {page}")
+                    break
 
     logging.info("Finished paginating through all people")
@@ -0,0 +1,108 @@
+import orjson
+import pytest
+from src.mal_anime.anime_checkpoint import AnimeCheckpointHandler
+from src.mal_anime.checkpoint import CheckpointHandler
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    return str(tmp_path / "anime_checkpoint.json")
+
+
+def write_json(path, data):
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data))
+
+
+def test_fresh_checkpoint(checkpoint_path):
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.get_completed_count() == 0
+    assert checkpoint.get_pagination_state() == (None, 0)
+    assert not checkpoint.is_completed(1)
+    checkpoint.close()
+
+
+def test_save_and_load(checkpoint_path):
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    for anime_id in (1, 42, 42, 60000):
+        checkpoint.mark_completed(anime_id)
+    checkpoint.update_pagination("C", 2)
+    checkpoint.save_checkpoint()
+    checkpoint.close()
+
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.get_completed_count() == 3
+    assert checkpoint.is_completed(42) and checkpoint.is_completed(60000)
+    assert not checkpoint.is_completed(43)
+    assert checkpoint.completed_among([1, 2, 42, 10**9]) == {1, 42}
+    assert checkpoint.get_pagination_state() == ("C", 2)
+    checkpoint.close()
+
+
+def test_close_saves_pending_state(checkpoint_path):
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    checkpoint.mark_completed(7)
+    checkpoint.update_pagination("D", 1)
+    checkpoint.close()
+
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.is_completed(7)
+    assert checkpoint.get_pagination_state() == ("D", 1)
+    checkpoint.close()
+
+
+def test_imports_completed_ids_list(checkpoint_path):
+    # The format written before the bitmap checkpoint
+    write_json(
+        checkpoint_path,
+        {"completed_ids": [1, 5, 900], "current_letter": "B", "current_page": 3},
+    )
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.get_completed_count() == 3
+    assert checkpoint.completed_among(range(1000)) == {1, 5, 900}
+    assert checkpoint.get_pagination_state() == ("B", 3)
+    checkpoint.close()
+
+    # The IDs now live in the bitmap, not the JSON
+    with open(checkpoint_path, "rb") as f:
+        assert "completed_ids" not in orjson.loads(f.read())
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.completed_among(range(1000)) == {1, 5, 900}
+    checkpoint.close()
+
+
+def test_corrupt_checkpoint_falls_back_to_backup(checkpoint_path):
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    checkpoint.update_pagination("E", 4)
+    checkpoint.save_checkpoint()
+    checkpoint.update_pagination("E", 5)
+    checkpoint.save_checkpoint()
+    checkpoint.close()
+
+    with open(checkpoint_path, "w") as f:
+        f.write('{"current_letter": "E", "curr')
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.get_pagination_state() == ("E", 4)
+    checkpoint.close()
+
+
+def test_unreadable_checkpoint_raises(checkpoint_path):
+    for path in (checkpoint_path, f"{checkpoint_path}.bak"):
+        with open(path, "w") as f:
+            f.write("not json")
+    with pytest.raises(orjson.JSONDecodeError):
+        AnimeCheckpointHandler(checkpoint_path)
+
+
+def test_delete_files(checkpoint_path):
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    checkpoint.mark_completed(1)
+    checkpoint.save_checkpoint()
+    checkpoint.save_checkpoint()
+    checkpoint.close()
+
+    assert CheckpointHandler.delete_files(checkpoint_path)
+    assert not CheckpointHandler.delete_files(checkpoint_path)
+    checkpoint = AnimeCheckpointHandler(checkpoint_path)
+    assert checkpoint.get_completed_count() == 0
+    checkpoint.close()
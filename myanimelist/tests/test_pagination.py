@@ -0,0 +1,73 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from src.mal_anime import utils
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class RecordingCheckpoint:
+    """Checkpoint stand-in that records every page pagination processes."""
+
+    def __init__(self, completed=()):
+        self.completed = set(completed)
+        self.pages = []
+
+    def get_pagination_state(self):
+        return None, 0
+
+    def update_pagination(self, letter, page):
+        self.pages.append((letter, page))
+
+    def completed_among(self, item_ids):
+        return self.completed.intersection(item_ids)
+
+
+@pytest.fixture
+def listing(monkeypatch):
+    # Letter A has a full page (50 links, anime 110 listed twice) and then a
+    # short last page; any other page is empty
+    pages = {
+        ("A", 0): (FIXTURES / "anime_listing_full.html").read_bytes(),
+        ("A", 1): (FIXTURES / "anime_listing_last.html").read_bytes(),
+    }
+
+    async def fetch_listing(client, limiter, kind, letter, page):
+        return pages.get((letter, page), b"")
+
+    monkeypatch.setattr(utils, "_fetch_listing", fetch_listing)
+    monkeypatch.setattr(utils, "LETTERS", "A")
+
+
+def collect_anime(checkpoint):
+    async def collect():
+        return [batch async for batch in utils.paginate_anime(None, checkpoint)]
+
+    return asyncio.run(collect())
+
+
+def test_duplicate_entries_do_not_end_the_letter(listing):
+    checkpoint = RecordingCheckpoint()
+    batches = collect_anime(checkpoint)
+
+    ids = [anime["id"] for batch in batches for anime in batch]
+    # Anime 110 is yielded once, and the page after the full one is still read
+    assert ids == list(range(101, 150)) + [201, 202, 203]
+    # The short page ends the letter without consuming the empty page after it
+    assert checkpoint.pages == [("A", 0), ("A", 1)]
+
+
+def test_entry_fields(listing):
+    first = collect_anime(RecordingCheckpoint())[0][0]
+    assert first == {
+        "id": 101,
+        "title": "Show 101",
+        "url": "https://myanimelist.net/anime/101",
+        "page_url": "https://myanimelist.net/anime/101/Show_101",
+    }
+
+
+def test_completed_entries_are_skipped(listing):
+    batches = collect_anime(RecordingCheckpoint(completed=range(101, 150)))
+    assert [[anime["id"] for anime in batch] for batch in batches] == [[201, 202, 203]]
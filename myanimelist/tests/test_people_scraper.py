@@ -0,0 +1,108 @@
+import asyncio
+import gzip
+from pathlib import Path
+
+import orjson
+import pytest
+from src.mal_anime import people_scraper
+from src.mal_anime.people_checkpoint import PeopleCheckpointHandler
+from src.mal_anime.people_scraper import (
+    GCSBatchedJSONLStorage,
+    MALPeopleScraper,
+    VADataTransformer,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.content_encoding = None
+
+    def upload_from_file(self, body, content_type=None):
+        if self.bucket.failures:
+            self.bucket.failures -= 1
+            raise ConnectionError("upload failed")
+        self.bucket.uploads.append(gzip.decompress(body.read()).splitlines())
+
+
+class FakeBucket:
+    """Records uploaded shards; the first `failures` uploads raise."""
+
+    name = "test-bucket"
+
+    def __init__(self):
+        self.failures = 0
+        self.uploads = []
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+class FakeClient:
+    def __init__(self, project=None):
+        self._bucket = FakeBucket()
+
+    def bucket(self, name):
+        return self._bucket
+
+
+@pytest.fixture
+def batched_storage(monkeypatch):
+    monkeypatch.setattr(people_scraper.storage, "Client", FakeClient)
+    # One record per shard, so every record is uploaded on its own
+    return GCSBatchedJSONLStorage("test-bucket", "test-project", max_records=1)
+
+
+def test_store_only_buffers(batched_storage):
+    batched_storage.store({"id": 1}, "data/1.json")
+    batched_storage.store({"id": 2}, "data/2.json")
+    assert batched_storage.bucket.uploads == []
+
+    batched_storage.flush()
+    assert batched_storage.bucket.uploads == [[b'{"id":1}'], [b'{"id":2}']]
+
+
+def test_failed_flush_keeps_records_for_the_next_one(batched_storage):
+    batched_storage.store({"id": 1}, "data/1.json")
+    batched_storage.store({"id": 2}, "data/2.json")
+    batched_storage.bucket.failures = 1
+    with pytest.raises(ConnectionError):
+        batched_storage.flush()
+
+    batched_storage.flush()
+    assert batched_storage.bucket.uploads == [[b'{"id":1}'], [b'{"id":2}']]
+
+
+def test_ids_are_checkpointed_after_a_failed_upload(
+    batched_storage, monkeypatch, tmp_path
+):
+    html = (FIXTURES / "people_185.html").read_bytes()
+
+    async def scrape_async(self, url, session):
+        return {"html": html, "url": url}
+
+    async def paginate_people(client, checkpoint_handler, before_next_page, limiter):
+        # Two listing pages, each drained before the next one is handed out
+        for batch in ([(185, "u/185")], [(186, "u/186")]):
+            await before_next_page()
+            yield batch
+
+    monkeypatch.setattr(MALPeopleScraper, "scrape_async", scrape_async)
+    monkeypatch.setattr(people_scraper, "paginate_people", paginate_people)
+    # The flush after the first page fails; the final one succeeds
+    batched_storage.bucket.failures = 1
+
+    checkpoint_path = str(tmp_path / "people_checkpoint.json")
+    scraper = MALPeopleScraper(VADataTransformer(), batched_storage)
+    asyncio.run(scraper.scrape_all_people("data", checkpoint_path, fetch_workers=1))
+
+    uploaded = [
+        orjson.loads(line) for shard in batched_storage.bucket.uploads for line in shard
+    ]
+    assert sorted(record["_airbyte_data"]["people_id"] for record in uploaded) == [185, 186]
+    checkpoint = PeopleCheckpointHandler(checkpoint_path)
+    assert checkpoint.completed_among([185, 186]) == {185, 186}
+    checkpoint.close()
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from src.mal_anime.retry import HostRateLimiter
+
+HOST = "myanimelist.net"
+
+
+def delay_after(headers):
+    """Seconds the next request to HOST waits after a response with headers."""
+    limiter = HostRateLimiter(interval=1.0, burst=4)
+    limiter.update(HOST, headers)
+    return limiter.reserve_delay(HOST)
+
+
+def test_no_headers_do_not_defer():
+    assert delay_after({}) == 0
+
+
+def test_retry_after():
+    assert delay_after({"Retry-After": "30"}) == pytest.approx(30, abs=1)
+
+
+def test_unparseable_retry_after_waits_one_interval():
+    assert delay_after({"Retry-After": "soon"}) == pytest.approx(1, abs=0.5)
+
+
+def test_reset_as_delta():
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+    assert delay_after(headers) == pytest.approx(30, abs=1)
+
+
+def test_reset_as_epoch():
+    reset = time.time() + 10
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}
+    assert delay_after(headers) == pytest.approx(10, abs=1)
+
+
+def test_reset_as_past_epoch_does_not_defer():
+    reset = time.time() - 5
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}
+    assert delay_after(headers) == pytest.approx(0, abs=0.1)
+
+
+def test_remaining_budget_does_not_defer():
+    headers = {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "30"}
+    assert delay_after(headers) == 0
+
+
+def test_hosts_are_limited_separately():
+    limiter = HostRateLimiter(interval=1.0, burst=1)
+    limiter.update(HOST, {"Retry-After": "30"})
+    assert limiter.reserve_delay("cdn.myanimelist.net") == 0
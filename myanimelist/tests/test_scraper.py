@@ -8,23 +8,23 @@ from src.mal_anime.scraper import (
     MALAnimeScraper
 )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def url_generator():
     return MALUrlGenerator()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_scraper():
     return MALScraper()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_transformer():
     return MALDataTransformer()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_storage():
     return JSONDataStorage()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scraper(url_generator, data_scraper, data_transformer, data_storage):
     return MALAnimeScraper(
         url_generator=url_generator,
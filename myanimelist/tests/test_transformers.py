@@ -0,0 +1,62 @@
+import json
+import pickle
+import uuid
+from pathlib import Path
+
+import pytest
+from src.mal_anime.scraper import CharactersPageRequest, MALDataTransformer
+from src.mal_anime.people_scraper import VADataTransformer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+CHARACTERS_URL = "https://myanimelist.net/anime/1/Cowboy_Bebop/characters"
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_bytes()
+
+
+def load_expected(name):
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def anime_raw_data():
+    # The pipeline prefetches the Characters & Staff page alongside the anime page
+    return {
+        "html": read_fixture("anime_1.html"),
+        "url": "https://myanimelist.net/anime/1",
+        "characters_page": {
+            "html": read_fixture("anime_1_characters.html"),
+            "url": CHARACTERS_URL,
+        },
+    }
+
+
+def test_anime_transform_matches_expected(anime_raw_data):
+    # anime_1.json is the output of the original BeautifulSoup transformer
+    record = MALDataTransformer().transform(anime_raw_data, 1)
+    assert record["_airbyte_data"] == load_expected("anime_1.json")
+
+
+def test_anime_transform_envelope(anime_raw_data):
+    record = MALDataTransformer().transform(anime_raw_data, 1)
+    assert uuid.UUID(record["_airbyte_ab_id"]).version == 4
+    assert isinstance(record["_airbyte_emitted_at"], int)
+
+
+def test_unpickled_anime_transformer_asks_for_missing_characters_page(anime_raw_data):
+    # Parse workers get an unpickled transformer, which must never fetch
+    transformer = pickle.loads(pickle.dumps(MALDataTransformer()))
+    raw_data = dict(anime_raw_data, characters_page=None)
+    assert transformer.transform(raw_data, 1) == CharactersPageRequest(CHARACTERS_URL)
+
+
+def test_voice_actor_transform_matches_expected():
+    # people_185.json is the output of the original BeautifulSoup transformer
+    raw_data = {
+        "html": read_fixture("people_185.html"),
+        "url": "https://myanimelist.net/people/185/",
+    }
+    record = VADataTransformer().transform(raw_data, 185)
+    assert record["_airbyte_data"] == load_expected("people_185.json")
+    assert uuid.UUID(record["_airbyte_ab_id"]).version == 4